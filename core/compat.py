@@ -0,0 +1,25 @@
+"""
+Turtle Trader - Compatibility Helpers
+Interpreter-version and optional-dependency shims shared across modules
+"""
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space-indented JSON bytes; orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+__all__ = ["DATACLASS_SLOTS", "ORJSON_AVAILABLE", "dumps_indented"]
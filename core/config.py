@@ -3,17 +3,22 @@ Turtle Trader - Advanced AI/ML Trading System
 Core Configuration and Utilities Module
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import configparser
 import logging
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from datetime import datetime, timedelta
-import pandas as pd
 import numpy as np
 from loguru import logger
 from pathlib import Path
 
+if TYPE_CHECKING:
+    # Annotation-only: keeps pandas off the import path of every config user
+    import pandas as pd
+
 class Config:
     """Configuration manager for the trading system"""
     
@@ -81,7 +86,8 @@ class Config:
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
             rotation="10 MB",
             retention="30 days",
-            compression="zip"
+            compression="zip",
+            enqueue=True  # File writes/rotation happen off the logging thread
         )
 
 class Constants:
@@ -139,6 +145,10 @@ class Constants:
     CATBOOST = "CatBoost"
     ENSEMBLE = "Ensemble"
 
+# Session bounds parsed once; is_market_open sits on polling paths
+_MARKET_OPEN_TIME = datetime.strptime(Constants.MARKET_OPEN, "%H:%M").time()
+_MARKET_CLOSE_TIME = datetime.strptime(Constants.MARKET_CLOSE, "%H:%M").time()
+
 class Utils:
     """Utility functions for the trading system"""
     
@@ -148,11 +158,8 @@ class Utils:
         now = datetime.now()
         if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
             return False
-            
-        market_open = datetime.strptime(Constants.MARKET_OPEN, "%H:%M").time()
-        market_close = datetime.strptime(Constants.MARKET_CLOSE, "%H:%M").time()
         
-        return market_open <= now.time() <= market_close
+        return _MARKET_OPEN_TIME <= now.time() <= _MARKET_CLOSE_TIME
     
     @staticmethod
     def format_currency(amount: float) -> str:
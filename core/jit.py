@@ -0,0 +1,19 @@
+"""
+Turtle Trader - Optional Numba JIT
+Kept apart from core.compat so only modules with kernels pay for importing numba
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels stay importable without numba"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
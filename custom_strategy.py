@@ -10,6 +10,7 @@ Strategy Rules:
 5. MTF orders first, CNC as fallback
 """
 
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -20,15 +21,54 @@ import logging
 
 from etf_manager import ETFOrderType, ETFOrderRequest, etf_order_manager
 from core.config import config
+from core.compat import DATACLASS_SLOTS
+from core.jit import NUMBA_AVAILABLE, njit, prange
 
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _position_pnl(entry_price, current_price, quantity):
+    """Return (profit_percent, profit_amount) for a long position"""
+    diff = current_price - entry_price
+    return (diff / entry_price) * 100.0, diff * quantity
+
+@njit(cache=True)
+def _price_change_pct_nb(current, yesterday_close, change_out):
+    """Percent change from yesterday's close; 0 where the close is 0"""
+    for i in range(current.shape[0]):
+        prev = yesterday_close[i]
+        if prev == 0:
+            change_out[i] = 0.0
+        else:
+            change_out[i] = ((current[i] - prev) / prev) * 100.0
+
+# Signal sort rank by urgency
+_URGENCY_ORDER = {"HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
+# evaluate_positions action bits
+_ACTION_SELL = 1
+_ACTION_ALERT = 2
+
+# No fastmath: unpriced positions are NaN and must compare False
+@njit(parallel=True, cache=True)
+def _evaluate_positions_nb(entry, current, sell_target, loss_alert, profit_pct_out, action_out):
+    """Fill profit percentages and SELL/ALERT action bits for every open position"""
+    for i in prange(entry.shape[0]):
+        pct = ((current[i] - entry[i]) / entry[i]) * 100.0
+        profit_pct_out[i] = pct
+        code = 0
+        if pct >= sell_target:
+            code |= _ACTION_SELL
+        if -pct >= loss_alert:
+            code |= _ACTION_ALERT
+        action_out[i] = code
+
 class PositionStatus(Enum):
     NO_POSITION = "NO_POSITION"
     OPEN_LONG = "OPEN_LONG"
     WAITING_SELL = "WAITING_SELL"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ETFPosition:
     symbol: str
     entry_price: float
@@ -39,7 +79,7 @@ class ETFPosition:
     target_price: float
     alert_price: float
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CustomSignal:
     symbol: str
     action: str  # BUY, SELL, ALERT
@@ -49,6 +89,49 @@ class CustomSignal:
     order_type: ETFOrderType
     urgency: str  # HIGH, MEDIUM, LOW
 
+class _OpenPositionArrays:
+    """
+    Structure-of-arrays mirror of open positions
+
+    Keeps entry prices in a contiguous array with a symbol -> row index so
+    that sell/alert checks for every open position run as one vectorized
+    pass. Rows are swap-removed on close to keep the arrays dense.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.symbols: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.entry_price = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def add(self, symbol: str, entry_price: float):
+        """Track (or re-price) an open position"""
+        row = self.index.get(symbol)
+        if row is None:
+            row = len(self.symbols)
+            if row == len(self.entry_price):
+                grown = np.empty(max(16, row * 2), dtype=np.float64)
+                grown[:row] = self.entry_price[:row]
+                self.entry_price = grown
+            self.symbols.append(symbol)
+            self.index[symbol] = row
+        self.entry_price[row] = entry_price
+
+    def remove(self, symbol: str):
+        """Drop a closed position, moving the last row into its slot"""
+        row = self.index.pop(symbol, None)
+        if row is None:
+            return
+        last = len(self.symbols) - 1
+        if row != last:
+            moved = self.symbols[last]
+            self.symbols[row] = moved
+            self.entry_price[row] = self.entry_price[last]
+            self.index[moved] = row
+        self.symbols.pop()
+
 class CustomETFStrategy:
     """
     Custom ETF Strategy: 1% Dip Buy, 3% Target Sell, 5% Loss Alert
@@ -57,6 +140,11 @@ class CustomETFStrategy:
     def __init__(self):
         self.name = "Custom ETF Dip Strategy"
         self.positions: Dict[str, ETFPosition] = {}
+        self._open_arrays = _OpenPositionArrays()
+        
+        # MTF/CNC decisions hit the funds API; reuse them briefly per symbol
+        self.order_type_cache_ttl = 30.0  # seconds
+        self._order_type_cache: Dict[str, Tuple[float, ETFOrderType]] = {}
         
         # Strategy parameters from config
         self.buy_dip_percent = float(config.get('TRADING', 'BUY_DIP_PERCENT', fallback='1.0'))
@@ -65,9 +153,14 @@ class CustomETFStrategy:
         self.mtf_first_priority = config.getboolean('TRADING', 'MTF_FIRST_PRIORITY', fallback=True)
         self.one_position_per_etf = config.getboolean('TRADING', 'ONE_POSITION_PER_ETF', fallback=True)
         
+        # Entry-price multipliers for target/alert levels, fixed by config
+        self._target_multiplier = 1 + self.sell_target_percent / 100
+        self._alert_multiplier = 1 - self.loss_alert_percent / 100
+        
         # ETF symbols to monitor
         self.etf_symbols = config.get('TRADING', 'SYMBOLS', fallback='').split(',')
         self.etf_symbols = [s.strip() for s in self.etf_symbols if s.strip()]
+        self._etf_symbol_set = frozenset(self.etf_symbols)
         
         logger.info(f"Custom ETF Strategy initialized")
         logger.info(f"Buy Dip: {self.buy_dip_percent}%, Sell Target: {self.sell_target_percent}%")
@@ -101,6 +194,17 @@ class CustomETFStrategy:
         if not self.mtf_first_priority:
             return ETFOrderType.CNC
         
+        now = time.monotonic()
+        cached = self._order_type_cache.get(symbol)
+        if cached is not None and now - cached[0] < self.order_type_cache_ttl:
+            return cached[1]
+        
+        order_type = self._resolve_order_type(symbol)
+        self._order_type_cache[symbol] = (now, order_type)
+        return order_type
+    
+    def _resolve_order_type(self, symbol: str) -> ETFOrderType:
+        """Query MTF margin availability for ``symbol`` (uncached)"""
         try:
             # Try MTF first
             if etf_order_manager._check_mtf_margin_available(symbol):
@@ -146,7 +250,7 @@ class CustomETFStrategy:
         """
         Check if position should be sold (3% profit target)
         """
-        profit_percent = ((current_price - position.entry_price) / position.entry_price) * 100
+        profit_percent, _ = _position_pnl(position.entry_price, current_price, position.quantity)
         
         # Sell signal: profit reached target
         if profit_percent >= self.sell_target_percent:
@@ -166,7 +270,8 @@ class CustomETFStrategy:
         """
         Check if position needs loss alert (5% loss)
         """
-        loss_percent = ((position.entry_price - current_price) / position.entry_price) * 100
+        profit_percent, _ = _position_pnl(position.entry_price, current_price, position.quantity)
+        loss_percent = -profit_percent
         
         # Alert signal: loss reached alert threshold
         if loss_percent >= self.loss_alert_percent:
@@ -226,6 +331,88 @@ class CustomETFStrategy:
         
         return signals
     
+    def evaluate_buy_candidates(self, symbols: List[str], current_prices: List[float],
+                                yesterday_closes: List[float]) -> List[CustomSignal]:
+        """
+        Check flat ETFs for the dip-buy condition in one pass
+        
+        Equivalent to check_buy_signal per symbol, but the price-change math
+        runs over arrays; signals are only built for ETFs past the dip.
+        """
+        current = np.asarray(current_prices, dtype=np.float64)
+        yesterday = np.asarray(yesterday_closes, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            change_pct = np.empty(len(current), dtype=np.float64)
+            _price_change_pct_nb(current, yesterday, change_pct)
+        else:
+            change_pct = np.zeros(len(current), dtype=np.float64)
+            np.divide(current - yesterday, yesterday, out=change_pct, where=yesterday != 0)
+            change_pct *= 100
+        
+        signals = []
+        for row in np.flatnonzero(change_pct <= -self.buy_dip_percent):
+            signal = self.check_buy_signal(symbols[row], float(current[row]), float(yesterday[row]))
+            if signal:
+                signals.append(signal)
+        
+        return signals
+    
+    def evaluate_positions(self, current_prices: Dict[str, float]) -> List[CustomSignal]:
+        """
+        Check every open position for sell/alert signals in one vectorized pass
+        
+        Equivalent to calling check_sell_signal and check_alert_signal per
+        position, but the percentage math runs over the SoA entry-price array.
+        Positions without a price in ``current_prices`` are skipped.
+        """
+        arrays = self._open_arrays
+        n = len(arrays)
+        if n == 0:
+            return []
+        
+        current = np.fromiter((current_prices.get(s, np.nan) for s in arrays.symbols),
+                              dtype=np.float64, count=n)
+        entry = arrays.entry_price[:n]
+        if NUMBA_AVAILABLE:
+            profit_pct = np.empty(n, dtype=np.float64)
+            actions = np.empty(n, dtype=np.uint8)
+            _evaluate_positions_nb(entry, current, self.sell_target_percent,
+                                   self.loss_alert_percent, profit_pct, actions)
+        else:
+            profit_pct = ((current - entry) / entry) * 100
+            # NaN prices compare False, so unpriced positions never trigger
+            actions = ((profit_pct >= self.sell_target_percent) * _ACTION_SELL
+                       | (-profit_pct >= self.loss_alert_percent) * _ACTION_ALERT)
+        
+        signals = []
+        positions = self.positions
+        symbols = arrays.symbols
+        for row in np.flatnonzero(actions):
+            position = positions[symbols[row]]
+            price = float(current[row])
+            if actions[row] & _ACTION_SELL:
+                signals.append(CustomSignal(
+                    symbol=position.symbol,
+                    action="SELL",
+                    current_price=price,
+                    yesterday_close=position.entry_price,
+                    reason=f"Target reached: {profit_pct[row]:.2f}% profit (₹{price:.2f})",
+                    order_type=position.order_type,
+                    urgency="HIGH"
+                ))
+            if actions[row] & _ACTION_ALERT:
+                signals.append(CustomSignal(
+                    symbol=position.symbol,
+                    action="ALERT",
+                    current_price=price,
+                    yesterday_close=position.entry_price,
+                    reason=f"⚠️ LOSS ALERT: {-profit_pct[row]:.2f}% loss (₹{price:.2f})",
+                    order_type=position.order_type,
+                    urgency="HIGH"
+                ))
+        
+        return signals
+    
     def execute_buy_order(self, signal: CustomSignal) -> bool:
         """
         Execute buy order and track position
@@ -239,8 +426,8 @@ class CustomETFStrategy:
             )
             
             # Calculate target and alert prices
-            target_price = signal.current_price * (1 + self.sell_target_percent / 100)
-            alert_price = signal.current_price * (1 - self.loss_alert_percent / 100)
+            target_price = signal.current_price * self._target_multiplier
+            alert_price = signal.current_price * self._alert_multiplier
             
             # Track position
             self.positions[signal.symbol] = ETFPosition(
@@ -253,6 +440,7 @@ class CustomETFStrategy:
                 target_price=target_price,
                 alert_price=alert_price
             )
+            self._open_arrays.add(signal.symbol, signal.current_price)
             
             logger.info(f"✅ BUY ORDER: {signal.symbol} @ ₹{signal.current_price:.2f}")
             logger.info(f"   Order Type: {signal.order_type.value}")
@@ -284,11 +472,12 @@ class CustomETFStrategy:
             )
             
             # Calculate profit/loss
-            profit_amount = (signal.current_price - position.entry_price) * position.quantity
-            profit_percent = ((signal.current_price - position.entry_price) / position.entry_price) * 100
+            profit_percent, profit_amount = _position_pnl(
+                position.entry_price, signal.current_price, position.quantity)
             
             # Close position
             self.positions[signal.symbol].status = PositionStatus.NO_POSITION
+            self._open_arrays.remove(signal.symbol)
             
             logger.info(f"✅ SELL ORDER: {signal.symbol} @ ₹{signal.current_price:.2f}")
             logger.info(f"   Profit: ₹{profit_amount:.2f} ({profit_percent:.2f}%)")
@@ -326,14 +515,41 @@ class CustomETFStrategy:
         
         logger.info(f"🔍 Analyzing {len(etf_market_data)} ETFs for custom strategy signals...")
         
+        # Gather prices, then evaluate open positions and flat ETFs in batches
+        held_prices = {}
+        flat_symbols, flat_current, flat_yesterday = [], [], []
+        etf_symbol_set = self._etf_symbol_set
+        positions = self.positions
+        open_index = self._open_arrays.index
         for symbol, data in etf_market_data.items():
-            if symbol in self.etf_symbols:
-                signals = self.analyze_etf(symbol, data)
-                all_signals.extend(signals)
+            if symbol not in etf_symbol_set:
+                continue
+            # One bad frame skips only its own symbol, held or flat
+            try:
+                if len(data) < 2:
+                    logger.warning(f"Insufficient data for {symbol}")
+                    continue
+                closes = data['close']
+                current_price = float(closes.iloc[-1])
+                if symbol in positions:
+                    if symbol in open_index:
+                        held_prices[symbol] = current_price
+                    continue
+                yesterday_close = float(closes.iloc[-2])
+            except Exception as e:
+                logger.error(f"Error analyzing {symbol}: {e}")
+                continue
+            flat_symbols.append(symbol)
+            flat_current.append(current_price)
+            flat_yesterday.append(yesterday_close)
+        
+        if held_prices:
+            all_signals.extend(self.evaluate_positions(held_prices))
+        if flat_symbols:
+            all_signals.extend(self.evaluate_buy_candidates(flat_symbols, flat_current, flat_yesterday))
         
         # Sort by urgency
-        urgency_order = {"HIGH": 1, "MEDIUM": 2, "LOW": 3}
-        all_signals.sort(key=lambda x: urgency_order.get(x.urgency, 3))
+        all_signals.sort(key=lambda x: _URGENCY_ORDER.get(x.urgency, 3))
         
         return all_signals
     
@@ -357,14 +573,16 @@ class CustomETFStrategy:
         """
         Get summary of current positions
         """
+        # The SoA mirror lists exactly the open positions, so closed ones are never visited
+        open_symbols = self._open_arrays.symbols
         summary = {
-            'total_positions': len([p for p in self.positions.values() 
-                                  if p.status == PositionStatus.OPEN_LONG]),
+            'total_positions': len(open_symbols),
             'positions': {},
             'total_invested': 0
         }
         
-        for symbol, position in self.positions.items():
+        for symbol in open_symbols:
+            position = self.positions[symbol]
             if position.status == PositionStatus.OPEN_LONG:
                 invested_amount = position.entry_price * position.quantity
                 summary['positions'][symbol] = {
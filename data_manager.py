@@ -5,6 +5,8 @@ Handles market data collection, storage, and distribution
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import sqlite3
@@ -22,11 +24,18 @@ class DataManager:
     
     def __init__(self):
         self.db_path = "data/market_data.db"
-        self.cache = {}
+        self.cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
         self.cache_expiry = {}
         self.cache_duration = config.getint("MARKET_DATA", "CACHE_EXPIRY", 300)  # 5 minutes
+        self.cache_max_entries = config.getint("MARKET_DATA", "CACHE_MAX_ENTRIES", 128)
         self.running = False
         self.update_thread = None
+        self._stop_event = threading.Event()
+        
+        # Per-symbol fallback fetches are network-bound; created lazily on first use
+        self._fallback_pool: Optional[ThreadPoolExecutor] = None
+        # Guards LRU bookkeeping now that fallback fetches populate the cache concurrently
+        self._cache_lock = threading.Lock()
         
         # Initialize database
         self._init_database()
@@ -38,6 +47,7 @@ class DataManager:
     def start(self):
         """Start data management services"""
         self.running = True
+        self._stop_event.clear()
         self.update_thread = threading.Thread(target=self._background_update, daemon=True)
         self.update_thread.start()
         logger.info("Data Manager started")
@@ -45,6 +55,7 @@ class DataManager:
     def stop(self):
         """Stop data management services"""
         self.running = False
+        self._stop_event.set()
         logger.info("Data Manager stopped")
     
     def _init_database(self):
@@ -80,6 +91,12 @@ class DataManager:
             """)
             
             conn.commit()
+        
+        # Long-lived writer connection; WAL keeps readers unblocked during writes
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
     
     def _init_kite_client(self):
         """Initialize Kite API client"""
@@ -119,9 +136,11 @@ class DataManager:
             )
             
             if not data.empty:
-                # Store in database
+                # Persist full precision; only the in-memory copy is downcast
                 self._store_data(symbol, exchange, data, interval)
                 
+                data = self._compact_ohlcv(data)
+                
                 # Cache the data
                 self._cache_data(cache_key, data)
                 
@@ -177,7 +196,7 @@ class DataManager:
                 
                 # Cache the data
                 self._cache_data(cache_key, data, duration=30)
-                logger.debug(f"📊 LTP for {symbol}: ₹{ltp:.2f}")
+                logger.debug("📊 LTP for {}: ₹{:.2f}", symbol, ltp)
                 
                 return data
             
@@ -205,6 +224,71 @@ class DataManager:
         
         return pd.DataFrame()
     
+    def get_real_time_data_batch(self, symbols: List[str],
+                                 exchange: str = Constants.NSE) -> Dict[str, pd.DataFrame]:
+        """Get real-time data for many symbols with a single Kite quote call"""
+        result = {}
+        pending = []
+        for symbol in symbols:
+            cache_key = f"{symbol}_realtime"
+            if self._is_cache_valid(cache_key, duration=30):
+                result[symbol] = self.cache[cache_key]
+            else:
+                pending.append(symbol)
+        
+        if not pending:
+            return result
+        
+        try:
+            # One quote round-trip carries LTP and OHLC for every symbol;
+            # KiteAPIClient adds the NSE: prefix and keys results by bare symbol
+            quote_data = self.kite.get_quote(pending) or {}
+            current_time = datetime.now()
+            
+            for symbol in pending:
+                quote = quote_data.get(symbol)
+                if not quote or not quote.get('last_price'):
+                    continue
+                
+                ltp = float(quote['last_price'])
+                ohlc = quote.get('ohlc', {})
+                data = pd.DataFrame({
+                    'open': [float(ohlc.get('open', ltp))],
+                    'high': [float(ohlc.get('high', ltp))],
+                    'low': [float(ohlc.get('low', ltp))],
+                    'close': [ltp],
+                    'volume': [int(quote.get('volume', 0))]
+                }, index=[current_time])
+                
+                self._cache_data(f"{symbol}_realtime", data, duration=30)
+                result[symbol] = data
+                
+        except Exception as e:
+            logger.debug(f"Error getting batched real-time data: {e}")
+        
+        # Anything the batch could not price falls back to the per-symbol path,
+        # fetched concurrently so N misses cost ~one round-trip rather than N
+        missing = [symbol for symbol in pending if symbol not in result]
+        if len(missing) == 1:
+            result[missing[0]] = self.get_real_time_data(missing[0], exchange)
+        elif missing:
+            if self._fallback_pool is None:
+                self._fallback_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='rt-fallback')
+            
+            futures = [
+                (symbol, self._fallback_pool.submit(self.get_real_time_data, symbol, exchange))
+                for symbol in missing
+            ]
+            for symbol, future in futures:
+                try:
+                    result[symbol] = future.result()
+                except Exception as e:
+                    # One failed symbol must not poison the rest of the batch
+                    logger.debug(f"Error getting real-time data for {symbol}: {e}")
+                    result[symbol] = pd.DataFrame()
+        
+        return result
+    
     def get_ltp(self, symbol: str) -> Optional[float]:
         """Get Last Traded Price for a symbol"""
         try:
@@ -213,7 +297,7 @@ class DataManager:
             
             if ltp_data and instrument_key in ltp_data:
                 ltp = float(ltp_data[instrument_key]['last_price'])
-                logger.debug(f"📊 {symbol} LTP: ₹{ltp:.2f}")
+                logger.debug("📊 {} LTP: ₹{:.2f}", symbol, ltp)
                 return ltp
             
             return None
@@ -230,8 +314,9 @@ class DataManager:
             logger.error("❌ Cannot fetch LTPs: DataManager has no active Kite connection.")
             return {symbol: 0.0 for symbol in symbols}
         
-        # Process in batches to avoid API limits
-        batch_size = 50
+        # Process in batches to stay within API limits: Kite accepts up to
+        # 1000 instruments per LTP call and 500 per quote call (the fallback)
+        batch_size = 500
         for i in range(0, len(symbols), batch_size):
             batch_symbols = symbols[i:i + batch_size]
             
@@ -252,7 +337,7 @@ class DataManager:
                                 ltp = float(ltp_data[instrument_key]['last_price'])
                                 ltps[symbol] = ltp if ltp > 0 else 0.0
                                 if ltp > 0:
-                                    logger.debug(f"✅ {symbol}: ₹{ltp:.2f}")
+                                    logger.debug("✅ {}: ₹{:.2f}", symbol, ltp)
                             except (KeyError, ValueError, TypeError) as e:
                                 logger.warning(f"⚠️ Failed to parse LTP for {symbol}: {e}")
                                 ltps[symbol] = 0.0
@@ -304,18 +389,22 @@ class DataManager:
     def _store_data(self, symbol: str, exchange: str, data: pd.DataFrame, interval: str):
         """Store data in database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                for timestamp, row in data.iterrows():
-                    conn.execute("""
-                        INSERT OR REPLACE INTO market_data 
-                        (symbol, exchange, datetime, open, high, low, close, volume, interval)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        symbol, exchange, timestamp, 
-                        float(row['open']), float(row['high']), float(row['low']), 
-                        float(row['close']), int(row.get('volume', 0)), interval
-                    ))
-                conn.commit()
+            volume = data['volume'] if 'volume' in data else [0] * len(data)
+            rows = [
+                (symbol, exchange, timestamp,
+                 float(open_), float(high), float(low), float(close), int(vol), interval)
+                for timestamp, open_, high, low, close, vol in zip(
+                    data.index, data['open'], data['high'], data['low'], data['close'], volume
+                )
+            ]
+            
+            # Single transaction on the persistent connection
+            with self._db_lock, self._conn:
+                self._conn.executemany("""
+                    INSERT OR REPLACE INTO market_data 
+                    (symbol, exchange, datetime, open, high, low, close, volume, interval)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
                 
         except Exception as e:
             logger.error(f"Error storing data for {symbol}: {e}")
@@ -347,24 +436,46 @@ class DataManager:
             logger.error(f"Error retrieving data from DB for {symbol}: {e}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _compact_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
+        """Keep only OHLCV columns with prices downcast to float32"""
+        columns = [col for col in ('open', 'high', 'low', 'close', 'volume') if col in data.columns]
+        if not columns:
+            return data
+        
+        data = data[columns]
+        price_columns = [col for col in columns if col != 'volume']
+        return data.astype({col: np.float32 for col in price_columns})
+    
     def _cache_data(self, key: str, data: pd.DataFrame, duration: int = None):
         """Cache data with expiry"""
         if duration is None:
             duration = self.cache_duration
             
-        self.cache[key] = data.copy()
-        self.cache_expiry[key] = datetime.now() + timedelta(seconds=duration)
+        data = data.copy()
+        with self._cache_lock:
+            self.cache[key] = data
+            self.cache.move_to_end(key)
+            self.cache_expiry[key] = datetime.now() + timedelta(seconds=duration)
+            
+            # Bound the cache: evict least recently used entries
+            while len(self.cache) > self.cache_max_entries:
+                evicted, _ = self.cache.popitem(last=False)
+                self.cache_expiry.pop(evicted, None)
     
     def _is_cache_valid(self, key: str, duration: int = None) -> bool:
         """Check if cached data is still valid"""
-        if key not in self.cache:
-            return False
-        
-        expiry_time = self.cache_expiry.get(key)
-        if expiry_time is None:
-            return False
-        
-        return datetime.now() < expiry_time
+        with self._cache_lock:
+            if key not in self.cache:
+                return False
+            
+            expiry_time = self.cache_expiry.get(key)
+            if expiry_time is None or datetime.now() >= expiry_time:
+                return False
+            
+            # A valid hit is about to be read; mark it most recently used
+            self.cache.move_to_end(key)
+            return True
     
     def _background_update(self):
         """Background thread for data updates"""
@@ -372,20 +483,21 @@ class DataManager:
             try:
                 # Clean expired cache entries
                 current_time = datetime.now()
-                expired_keys = [
-                    key for key, expiry in self.cache_expiry.items()
-                    if current_time > expiry
-                ]
-                
-                for key in expired_keys:
-                    del self.cache[key]
-                    del self.cache_expiry[key]
-                
-                time.sleep(60)  # Clean every minute
+                with self._cache_lock:
+                    expired_keys = [
+                        key for key, expiry in self.cache_expiry.items()
+                        if current_time > expiry
+                    ]
+                    
+                    for key in expired_keys:
+                        self.cache.pop(key, None)
+                        self.cache_expiry.pop(key, None)
                 
             except Exception as e:
                 logger.error(f"Error in background data update: {e}")
-                time.sleep(60)
+            
+            # Clean every minute; stop() wakes the thread immediately
+            self._stop_event.wait(60)
     
     # Yahoo Finance functions removed - using only Breeze API for real data
 
@@ -16,13 +16,23 @@ All calculations use percentages, not fixed amounts.
 Reserve capital is strictly off-limits for automated trades.
 """
 
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
-import json
+from datetime import datetime, timedelta
+import numpy as np
 from loguru import logger
 
-@dataclass
+from core.compat import DATACLASS_SLOTS
+from core.jit import NUMBA_AVAILABLE, njit
+
+# Per-open/close capital debug logging and the O(n) allocated-capital drift
+# check in validate_reserve_protection; off by default as both sit on the hot path
+_DEBUG_CAPITAL = False
+
+@dataclass(**DATACLASS_SLOTS)
 class TradeSignal:
     """Represents a trading signal/opportunity"""
     symbol: str
@@ -31,7 +41,7 @@ class TradeSignal:
     confidence: str   # 'HIGH', 'MEDIUM', 'LOW'
     timestamp: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ActiveTrade:
     """Represents an active trading position"""
     trade_id: int
@@ -41,6 +51,128 @@ class ActiveTrade:
     entry_time: datetime
     status: str = "ACTIVE"
 
+# Multi-line log templates, formatted by loguru in a single call
+_INIT_BANNER = (
+    "💼 Capital Allocator initialized with ₹{total:,.2f}\n"
+    "   🎯 Deployable: ₹{deployable:,.2f}\n"
+    "   🛡️ Reserve: ₹{reserve:,.2f}\n"
+    "   💰 Per Trade: ₹{per_trade:,.2f}"
+)
+_REFRESH_BANNER = (
+    "✅ Capital allocation refreshed!\n"
+    "   💰 Total Capital: ₹{old_total:,.2f} → ₹{total:,.2f} ({total_change:+,.2f})\n"
+    "   🎯 Deployable: ₹{old_deployable:,.2f} → ₹{deployable:,.2f} ({deployable_change:+,.2f})\n"
+    "   💰 Per Trade: ₹{old_per_trade:,.2f} → ₹{per_trade:,.2f} ({per_trade_change:+,.2f})"
+)
+
+_STATUS_REPORT = (
+    "\n📊 DYNAMIC CAPITAL ALLOCATION STATUS\n"
+    + "=" * 50 + "\n"
+    "💰 Total Capital:           ₹{total_capital:,.0f}\n"
+    "📈 Deployment ({deployment_percentage:.0f}%):      ₹{deployment_capital:,.0f}\n"
+    "🛡️  Reserve ({reserve_percentage:.0f}%):         ₹{reserve_capital:,.0f}\n"
+    "💼 Allocated:               ₹{allocated_capital:,.0f}\n"
+    "✅ Available:               ₹{available_deployment_capital:,.0f}\n"
+    "🎯 Per Trade:               ₹{per_trade_allocation:,.0f}\n"
+    "📊 Utilization:             {utilization_percentage:.1f}%\n"
+    "🔢 Active Trades:           {active_trades}\n"
+    "🏆 Max Capacity:            {max_possible_trades} trades\n"
+    "📈 Total P&L:               ₹{total_pnl:,.2f}\n"
+)
+
+def _to_paise(rupees: float) -> int:
+    """Convert a rupee amount to integer paise"""
+    return int(round(rupees * 100))
+
+
+class _SoAState:
+    """
+    Structure-of-arrays storage for open trades
+
+    Row ``i`` mirrors ``active_trades[i]`` so that bulk operations
+    (allocation sums, session simulation) run over contiguous arrays
+    instead of lists of dataclasses. Closing a trade swap-removes its row
+    in lockstep with ``active_trades``, so the store never holds more rows
+    than there are open trades. Allocations are int64 paise.
+    """
+
+    def __init__(self, capacity: int = 0):
+        self.allocated = np.empty(capacity, dtype=np.int64)
+        self.entry_price = np.empty(capacity, dtype=np.float64)
+        self.entry_time_ns = np.empty(capacity, dtype=np.int64)
+        self.n = 0
+
+    def _reserve(self, extra: int):
+        """Make room for ``extra`` more rows, growing capacity geometrically"""
+        needed = self.n + extra
+        capacity = len(self.allocated)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2, 16)
+        for name in ('allocated', 'entry_price', 'entry_time_ns'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def append(self, allocated: int, entry_price: float, entry_time: datetime) -> int:
+        """Append a single active trade and return its row index"""
+        self._reserve(1)
+        row = self.n
+        self.allocated[row] = allocated
+        self.entry_price[row] = entry_price
+        self.entry_time_ns[row] = int(entry_time.timestamp() * 1e9)
+        self.n += 1
+        return row
+
+    def extend(self, allocated: np.ndarray, entry_price: np.ndarray, entry_time_ns: np.ndarray) -> slice:
+        """Append a batch of active trades and return the written row slice"""
+        count = len(allocated)
+        self._reserve(count)
+        rows = slice(self.n, self.n + count)
+        self.allocated[rows] = allocated
+        self.entry_price[rows] = entry_price
+        self.entry_time_ns[rows] = entry_time_ns
+        self.n += count
+        return rows
+
+    def remove(self, row: int):
+        """Swap-remove ``row``: the last row moves into its place"""
+        last = self.n - 1
+        if row < last:
+            self.allocated[row] = self.allocated[last]
+            self.entry_price[row] = self.entry_price[last]
+            self.entry_time_ns[row] = self.entry_time_ns[last]
+        self.n = last
+
+    def active_allocated(self) -> int:
+        """Sum of capital (paise) allocated to open trades"""
+        return int(self.allocated[:self.n].sum())
+
+@njit(cache=True, fastmath=True)
+def _process_signals_nb(prices, is_buy, per_trade_alloc, avail,
+                        allocated_out, entry_price_out, decisions_out):
+    """
+    Decide a batch of signals against the available deployment capital
+
+    Capital amounts are integer paise. Executed trades are written
+    compactly into ``allocated_out`` and ``entry_price_out``;
+    ``decisions_out[i]`` is 1 when signal ``i`` was executed; nothing is
+    executed when the per-trade allocation is zero. Returns the number of
+    executed trades and remaining capital.
+    """
+    slot = 0
+    for i in range(prices.shape[0]):
+        if is_buy[i] and per_trade_alloc > 0 and avail >= per_trade_alloc:
+            allocated_out[slot] = per_trade_alloc
+            entry_price_out[slot] = prices[i]
+            decisions_out[i] = 1
+            avail -= per_trade_alloc
+            slot += 1
+        else:
+            decisions_out[i] = 0
+    return slot, avail
+
 class DynamicCapitalAllocator:
     """
     Dynamic Capital Allocation Engine
@@ -53,13 +185,16 @@ class DynamicCapitalAllocator:
     - REAL ACCOUNT BALANCE INTEGRATION
     """
     
-    def __init__(self, initial_capital: Optional[float] = None, use_real_balance: bool = True):
+    def __init__(self, initial_capital: Optional[float] = None, use_real_balance: bool = True,
+                 max_closed_history: Optional[int] = 10_000):
         """
         Initialize with capital amount (real or reference)
         
         Args:
             initial_capital: Starting capital (optional if using real balance)
             use_real_balance: If True, uses real Kite API account balance
+            max_closed_history: Closed trades / history entries to keep
+                                (None keeps the full history)
         """
         # Import here to avoid circular imports
         if use_real_balance:
@@ -76,6 +211,16 @@ class DynamicCapitalAllocator:
             self.use_real_balance = False
             self.balance_manager = None
         
+        # Short-lived balance cache so bursts of reads share one API round-trip
+        self.balance_cache_ttl = 0.25  # seconds
+        self._balance_cache: Optional[Tuple[float, object]] = None
+        
+        # Background prefetch of the balance for the next refresh
+        self.balance_prefetch_max_age = timedelta(seconds=30)
+        self._pending_balance: Optional[Future] = None
+        self._executor = (ThreadPoolExecutor(max_workers=1, thread_name_prefix="balance-prefetch")
+                          if self.use_real_balance else None)
+        
         # Initialize capital - ONLY real balance allowed
         if self.use_real_balance and self.balance_manager:
             self._initialize_with_real_balance()
@@ -84,13 +229,18 @@ class DynamicCapitalAllocator:
             raise ValueError("DynamicCapitalAllocator requires real account balance integration")
         
         # Step 3: Track Allocated Capital
-        self.allocated_capital = 0.0
+        self._allocated_paise = 0
         self.free_capital = self.deployable_capital
-        self.available_deployment_capital = self.deployable_capital  # Initially all deployable capital is available
+        self._available_paise = self._deployment_paise  # Initially all deployable capital is available
         self.active_trades: List[ActiveTrade] = []
-        self.closed_trades: List[ActiveTrade] = []
-        self.trade_history: List[Dict] = []
+        self._active_index: Dict[int, int] = {}  # trade_id -> position in active_trades
+        # Presize for the most trades the capital rules allow open at once
+        self._trades_soa = _SoAState(capacity=self._max_possible_trades + 4)
+        self.closed_trades: Deque[ActiveTrade] = deque(maxlen=max_closed_history)
+        self.trade_history: Deque[Dict] = deque(maxlen=max_closed_history)
         self.trade_counter = 0
+        self._n_active = 0
+        self._n_closed = 0  # counts every close, even those evicted from closed_trades
         
         # Performance tracking
         self.total_profit_loss = 0.0
@@ -100,15 +250,49 @@ class DynamicCapitalAllocator:
         # Initial capital tracking
         self.track_allocated_capital()
         
-        logger.info(f"💼 Capital Allocator initialized with ₹{self.total_capital:,.2f}")
-        logger.info(f"🎯 Deployable: ₹{self.deployable_capital:,.2f}")
-        logger.info(f"🛡️ Reserve: ₹{self.reserve_capital:,.2f}")
-        logger.info(f"💰 Per Trade: ₹{self.per_trade_amount:,.2f}")
+        logger.info(_INIT_BANNER, total=self.total_capital, deployable=self.deployable_capital,
+                    reserve=self.reserve_capital, per_trade=self.per_trade_amount)
 
-    def refresh_real_balance(self) -> bool:
+    # Capital bookkeeping is kept in integer paise; rupee views below
+    @property
+    def total_capital(self) -> float:
+        return self._total_paise / 100
+
+    @property
+    def deployment_capital(self) -> float:
+        return self._deployment_paise / 100
+
+    @property
+    def deployable_capital(self) -> float:
+        """Alias for deployment_capital (kept for compatibility)"""
+        return self._deployment_paise / 100
+
+    @property
+    def reserve_capital(self) -> float:
+        return self._reserve_paise / 100
+
+    @property
+    def allocated_capital(self) -> float:
+        return self._allocated_paise / 100
+
+    @property
+    def available_deployment_capital(self) -> float:
+        return self._available_paise / 100
+
+    @property
+    def per_trade_amount(self) -> float:
+        """Capital allocated to each new trade"""
+        return self._per_trade_paise / 100
+
+    def refresh_real_balance(self, not_before: Optional[datetime] = None) -> bool:
         """
         Refresh capital allocation based on current real account balance
         
+        Args:
+            not_before: Reject prefetched/cached balances fetched before this
+                        time (e.g. the balance-change event that triggered the
+                        refresh) and fetch a fresh one instead
+        
         Returns:
             bool: True if balance was refreshed successfully
         """
@@ -119,8 +303,9 @@ class DynamicCapitalAllocator:
         try:
             logger.info("🔄 Refreshing capital allocation with real account balance...")
             
-            # Get fresh balance
-            balance = self.balance_manager.get_current_balance(force_refresh=True)
+            # Get fresh balance (prefetched in the background when recent enough)
+            balance = (self._take_prefetched_balance(not_before)
+                       or self._get_cached_balance(force=True, not_before=not_before))
             if not balance or balance.free_cash <= 0:
                 logger.error("❌ Could not fetch valid account balance")
                 return False
@@ -131,11 +316,8 @@ class DynamicCapitalAllocator:
             old_per_trade = self.per_trade_amount
             
             # Update with new real balance
-            self.total_capital = balance.free_cash
-            self.deployable_capital = balance.deployable_capital
-            self.deployment_capital = self.deployable_capital  # Alias for compatibility
-            self.reserve_capital = balance.reserve_capital
-            self.per_trade_amount = balance.per_trade_capital
+            self._total_paise = _to_paise(balance.free_cash)
+            self._split_buckets()
             
             # Update free capital accounting for active trades
             self.free_capital = self.deployable_capital - self.allocated_capital
@@ -145,10 +327,17 @@ class DynamicCapitalAllocator:
             deployable_change = self.deployable_capital - old_deployable
             per_trade_change = self.per_trade_amount - old_per_trade
             
-            logger.info(f"✅ Capital allocation refreshed!")
-            logger.info(f"💰 Total Capital: ₹{old_total:,.2f} → ₹{self.total_capital:,.2f} ({total_change:+,.2f})")
-            logger.info(f"🎯 Deployable: ₹{old_deployable:,.2f} → ₹{self.deployable_capital:,.2f} ({deployable_change:+,.2f})")
-            logger.info(f"💰 Per Trade: ₹{old_per_trade:,.2f} → ₹{self.per_trade_amount:,.2f} ({per_trade_change:+,.2f})")
+            logger.info(_REFRESH_BANNER,
+                        old_total=old_total, total=self.total_capital, total_change=total_change,
+                        old_deployable=old_deployable, deployable=self.deployable_capital,
+                        deployable_change=deployable_change,
+                        old_per_trade=old_per_trade, per_trade=self.per_trade_amount,
+                        per_trade_change=per_trade_change)
+            
+            # Overlap the next refresh's API round-trip with signal processing
+            self._pending_balance = self._executor.submit(
+                self.balance_manager.get_current_balance, force_refresh=True
+            )
             
             return True
             
@@ -156,13 +345,56 @@ class DynamicCapitalAllocator:
             logger.error(f"❌ Failed to refresh real balance: {e}")
             return False
 
+    def _take_prefetched_balance(self, not_before: Optional[datetime] = None):
+        """
+        Consume the balance prefetched after the previous refresh
+        
+        Returns None when nothing is pending, the fetch failed, the result is
+        older than ``balance_prefetch_max_age``, or it predates ``not_before``.
+        """
+        pending, self._pending_balance = self._pending_balance, None
+        if pending is None:
+            return None
+        
+        try:
+            balance = pending.result(timeout=5)
+        except Exception as e:
+            logger.warning(f"⚠️ Balance prefetch failed: {e}")
+            return None
+        
+        if not balance or datetime.now() - balance.timestamp > self.balance_prefetch_max_age:
+            return None
+        if not_before is not None and balance.timestamp < not_before:
+            return None
+        return balance
+
+    def _get_cached_balance(self, force: bool = False, not_before: Optional[datetime] = None):
+        """
+        Get account balance, reusing a fresh fetch from the last ``balance_cache_ttl`` seconds
+        
+        Args:
+            force: Bypass the balance manager's own (longer) cache when the
+                   short-lived cache has expired
+            not_before: Ignore a cached balance fetched before this time
+        """
+        now = time.monotonic()
+        if (self._balance_cache is not None and now - self._balance_cache[0] < self.balance_cache_ttl
+                and (not_before is None or self._balance_cache[1].timestamp >= not_before)):
+            return self._balance_cache[1]
+        
+        balance = self.balance_manager.get_current_balance(force_refresh=force)
+        if balance and force:
+            # Only forced fetches are known to be fresh enough to share
+            self._balance_cache = (now, balance)
+        return balance
+
     def get_real_balance_status(self) -> Dict:
         """Get current real balance status and comparison"""
         if not self.use_real_balance or not self.balance_manager:
             return {'error': 'Real balance not available'}
         
         try:
-            balance = self.balance_manager.get_current_balance()
+            balance = self._get_cached_balance()
             if not balance:
                 return {'error': 'Could not fetch balance'}
             
@@ -193,11 +425,11 @@ class DynamicCapitalAllocator:
 
     def _initialize_with_real_balance(self):
         """Initialize using real Kite API account balance"""
-        balance = self.balance_manager.get_current_balance(force_refresh=True)
+        balance = self._get_cached_balance(force=True)
         
         if balance and balance.free_cash > 0:
             # Step 1: Initialize Parameters with REAL balance
-            self.total_capital = balance.free_cash
+            self._total_paise = _to_paise(balance.free_cash)
             self.deployment_percentage = 70.0    # 70% for deployment
             self.reserve_percentage = 30.0       # 30% reserve (untouchable)
             self.per_trade_percentage = 5.0      # 5% per trade
@@ -205,10 +437,7 @@ class DynamicCapitalAllocator:
             self.brokerage_percentage = 0.3      # 0.3% brokerage
             
             # Step 2: Calculate Capital Buckets with REAL amounts
-            self.deployable_capital = balance.deployable_capital
-            self.deployment_capital = self.deployable_capital  # Alias for compatibility
-            self.reserve_capital = balance.reserve_capital
-            self.per_trade_amount = balance.per_trade_capital
+            self._split_buckets()
             
             logger.info(f"✅ Real balance loaded: ₹{self.total_capital:,.2f} free cash")
         else:
@@ -218,7 +447,7 @@ class DynamicCapitalAllocator:
     def _initialize_with_reference_capital(self, initial_capital: float):
         """Initialize using reference capital amount"""
         # Step 1: Initialize Parameters
-        self.total_capital = initial_capital
+        self._total_paise = _to_paise(initial_capital)
         self.deployment_percentage = 70.0    # 70% for deployment
         self.reserve_percentage = 30.0       # 30% reserve (untouchable)
         self.per_trade_percentage = 5.0      # 5% per trade
@@ -226,41 +455,58 @@ class DynamicCapitalAllocator:
         self.brokerage_percentage = 0.3      # 0.3% brokerage
         
         # Step 2: Calculate Capital Buckets
-        self.deployable_capital = self.total_capital * (self.deployment_percentage / 100)
-        self.deployment_capital = self.deployable_capital  # Alias for compatibility
-        self.reserve_capital = self.total_capital * (self.reserve_percentage / 100)
-        self.per_trade_amount = self.deployable_capital * (self.per_trade_percentage / 100)
+        self._split_buckets()
         
         logger.info(f"📊 Reference capital mode: ₹{initial_capital:,.2f}")
 
+    def _split_buckets(self):
+        """
+        Split total capital into buckets in exact integer paise
+        
+        Percentages are applied as basis points and the reserve takes the
+        remainder, so deployment + reserve always equals total exactly.
+        This is the only place the buckets change, so the validity check is
+        cached here rather than recomputed on every status read.
+        """
+        deployment_bps = int(round(self.deployment_percentage * 100))
+        self._deployment_paise = self._total_paise * deployment_bps // 10000
+        self._reserve_paise = self._total_paise - self._deployment_paise
+        self._buckets_valid = self._deployment_paise + self._reserve_paise == self._total_paise
+        self._update_trade_sizing()
+
+    def _update_trade_sizing(self):
+        """Cache per-trade sizing; inputs only change when the buckets do"""
+        per_trade_bps = int(round(self.per_trade_percentage * 100))
+        self._per_trade_paise = self._deployment_paise * per_trade_bps // 10000
+        self._max_possible_trades = 10000 // per_trade_bps
+
     def calculate_capital_buckets(self):
         """
         Calculate Capital Buckets (Step 2)
         
         - deployment_capital = total_capital × deployment_percentage
-        - reserve_capital = total_capital × reserve_percentage
+        - reserve_capital = total_capital - deployment_capital (the reserve percentage)
         """
-        self.deployment_capital = self.total_capital * (self.deployment_percentage / 100)
-        self.deployable_capital = self.deployment_capital  # Alias for compatibility
-        self.reserve_capital = self.total_capital * (self.reserve_percentage / 100)
+        self._split_buckets()
         
-        logger.info(f"📊 Capital buckets calculated: "
-                   f"Deployment ₹{self.deployment_capital:,.0f} | "
-                   f"Reserve ₹{self.reserve_capital:,.0f}")
+        logger.info("📊 Capital buckets calculated: "
+                    "Deployment ₹{deployment:,.0f} | Reserve ₹{reserve:,.0f}",
+                    deployment=self.deployment_capital, reserve=self.reserve_capital)
 
     def track_allocated_capital(self):
         """
         Track Allocated Capital (Step 3)
         
-        - allocated_capital: Sum of all capital in open trades
+        - allocated_capital: Sum of all capital in open trades (maintained
+          incrementally on every open/close)
         - available_deployment_capital = deployment_capital - allocated_capital
         """
-        self.allocated_capital = sum(trade.allocated_amount for trade in self.active_trades)
-        self.available_deployment_capital = self.deployment_capital - self.allocated_capital
+        self._available_paise = self._deployment_paise - self._allocated_paise
         
-        logger.debug(f"💼 Capital tracking: "
-                    f"Allocated ₹{self.allocated_capital:,.0f} | "
-                    f"Available ₹{self.available_deployment_capital:,.0f}")
+        if _DEBUG_CAPITAL:
+            logger.debug(f"💼 Capital tracking: "
+                         f"Allocated ₹{self.allocated_capital:,.0f} | "
+                         f"Available ₹{self.available_deployment_capital:,.0f}")
 
     def process_trade_signal(self, signal: TradeSignal) -> Dict:
         """
@@ -281,11 +527,13 @@ class DynamicCapitalAllocator:
         if signal.signal_type != 'BUY':
             return {'status': 'SKIPPED', 'reason': 'Only BUY signals processed here'}
         
-        # Step 4.1: Calculate per_trade_allocation
-        per_trade_allocation = self.deployment_capital * (self.per_trade_percentage / 100)
+        # Step 4.1: per_trade_allocation is precomputed whenever the buckets change
+        per_trade_paise = self._per_trade_paise
+        per_trade_allocation = per_trade_paise / 100
         
         # Step 4.2: Check if available_deployment_capital ≥ per_trade_allocation
-        if self.available_deployment_capital >= per_trade_allocation:
+        # (a zero allocation, i.e. too little capital to size a trade, never executes)
+        if per_trade_paise > 0 and self._available_paise >= per_trade_paise:
             # Step 4.3: If yes - Allocate and place trade
             self.trade_counter += 1
             
@@ -299,9 +547,13 @@ class DynamicCapitalAllocator:
             )
             
             # Add to active trades
+            self._active_index[new_trade.trade_id] = self._n_active
             self.active_trades.append(new_trade)
+            self._n_active += 1
+            self._trades_soa.append(per_trade_paise, signal.price, signal.timestamp)
             
             # Update allocated capital tracking
+            self._allocated_paise += per_trade_paise
             self.track_allocated_capital()
             
             result = {
@@ -318,7 +570,7 @@ class DynamicCapitalAllocator:
             
         else:
             # Step 4.4: If no - Do not place trade
-            shortfall = per_trade_allocation - self.available_deployment_capital
+            shortfall = max(per_trade_paise - self._available_paise, 0) / 100
             
             result = {
                 'status': 'REJECTED',
@@ -326,13 +578,85 @@ class DynamicCapitalAllocator:
                 'required': per_trade_allocation,
                 'available': self.available_deployment_capital,
                 'shortfall': shortfall,
-                'message': f"Trade rejected: Need ₹{shortfall:,.0f} more capital"
+                'message': (f"Trade rejected: Need ₹{shortfall:,.0f} more capital" if per_trade_paise > 0
+                            else "Trade rejected: Per-trade allocation is ₹0")
             }
             
             logger.warning(f"❌ {result['message']}")
         
         return result
 
+    def process_signal_batch(self, signals: List[TradeSignal]) -> np.ndarray:
+        """
+        Process a batch of signals with no trade closes in between
+        
+        Per-trade allocation is constant until the next close, so the first
+        ``available // per_trade_allocation`` BUY signals are executed and the
+        rest rejected. Callers interleaving closes should split the batch
+        around them (or fall back to process_trade_signal).
+        
+        Args:
+            signals: Trade signals to process, in arrival order
+            
+        Returns:
+            Boolean array, True where the signal was executed
+        """
+        n = len(signals)
+        prices = np.fromiter((s.price for s in signals), dtype=np.float64, count=n)
+        is_buy = np.fromiter((s.signal_type == 'BUY' for s in signals), dtype=bool, count=n)
+        per_trade_paise = self._per_trade_paise
+        
+        if NUMBA_AVAILABLE:
+            decisions = np.empty(n, dtype=np.uint8)
+            allocated_out = np.empty(n, dtype=np.int64)
+            entry_price_out = np.empty(n, dtype=np.float64)
+            k, _ = _process_signals_nb(prices, is_buy, per_trade_paise, self._available_paise,
+                                       allocated_out, entry_price_out, decisions)
+            executed = decisions.astype(bool)
+            allocated_out = allocated_out[:k]
+            entry_price_out = entry_price_out[:k]
+        else:
+            # Prefix count of BUY signals against the remaining capacity
+            # (zero when the per-trade allocation is zero, as in the kernel)
+            if per_trade_paise > 0:
+                capacity = max(self._available_paise // per_trade_paise, 0)
+            else:
+                capacity = 0
+            executed = is_buy & (np.cumsum(is_buy) <= capacity)
+            k = int(executed.sum())
+            allocated_out = np.full(k, per_trade_paise, dtype=np.int64)
+            entry_price_out = prices[executed]
+        executed_idx = np.flatnonzero(executed)
+        
+        # Bulk-write executed trades into the SoA store
+        entry_time_ns = np.fromiter(
+            (int(signals[i].timestamp.timestamp() * 1e9) for i in executed_idx),
+            dtype=np.int64, count=k
+        )
+        self._trades_soa.extend(allocated_out, entry_price_out, entry_time_ns)
+        
+        # Materialize ActiveTrade views for the external API
+        per_trade_allocation = per_trade_paise / 100
+        first_id = self.trade_counter + 1
+        for offset, i in enumerate(executed_idx):
+            signal = signals[i]
+            new_trade = ActiveTrade(
+                trade_id=first_id + offset,
+                symbol=signal.symbol,
+                allocated_amount=per_trade_allocation,
+                entry_price=signal.price,
+                entry_time=signal.timestamp
+            )
+            self._active_index[new_trade.trade_id] = len(self.active_trades)
+            self.active_trades.append(new_trade)
+        self.trade_counter += k
+        self._n_active += k
+        
+        self._allocated_paise += int(allocated_out.sum())
+        self.track_allocated_capital()
+        
+        return executed
+
     def close_trade(self, trade_id: int, exit_price: float, reason: str = "Manual close") -> Dict:
         """
         When a Trade Closes (Step 5)
@@ -350,29 +674,32 @@ class DynamicCapitalAllocator:
         """
         
         # Find the trade
-        trade_to_close = None
-        for trade in self.active_trades:
-            if trade.trade_id == trade_id:
-                trade_to_close = trade
-                break
+        pos = self._active_index.pop(trade_id, None)
         
-        if not trade_to_close:
+        if pos is None:
             return {
                 'status': 'ERROR',
                 'message': f"Trade ID {trade_id} not found in active trades"
             }
+        trade_to_close = self.active_trades[pos]
+        
+        # Calculate P&L in paise
+        allocated_paise = int(self._trades_soa.allocated[pos])
+        shares = allocated_paise // _to_paise(trade_to_close.entry_price)
+        gross_proceeds_paise = shares * _to_paise(exit_price)
+        gross_pnl_paise = gross_proceeds_paise - allocated_paise
         
-        # Calculate P&L
-        shares = int(trade_to_close.allocated_amount / trade_to_close.entry_price)
-        gross_proceeds = shares * exit_price
-        gross_pnl = gross_proceeds - trade_to_close.allocated_amount
+        # Calculate charges (0.3% brokerage on sell), rounded to the nearest paisa
+        brokerage_paise = (gross_proceeds_paise * 3 + 500) // 1000
+        net_pnl_paise = gross_pnl_paise - brokerage_paise
         
-        # Calculate charges (0.3% brokerage on sell)
-        brokerage = gross_proceeds * 0.003
-        net_pnl = gross_pnl - brokerage
+        gross_proceeds = gross_proceeds_paise / 100
+        gross_pnl = gross_pnl_paise / 100
+        brokerage = brokerage_paise / 100
+        net_pnl = net_pnl_paise / 100
         
         # Update total capital with net P&L
-        self.total_capital += net_pnl
+        self._total_paise += net_pnl_paise
         
         # Recalculate capital buckets with new total
         self.calculate_capital_buckets()
@@ -380,9 +707,18 @@ class DynamicCapitalAllocator:
         # Move trade from active to closed
         trade_to_close.status = 'CLOSED'
         self.closed_trades.append(trade_to_close)
-        self.active_trades.remove(trade_to_close)
+        self._n_closed += 1
+        self._n_active -= 1
+        
+        # Swap-remove: move the last active trade into the freed slot
+        last = self.active_trades.pop()
+        if pos < self._n_active:
+            self.active_trades[pos] = last
+            self._active_index[last.trade_id] = pos
+        self._trades_soa.remove(pos)
         
         # Update allocated capital tracking
+        self._allocated_paise -= allocated_paise
         self.track_allocated_capital()
         
         result = {
@@ -415,9 +751,10 @@ class DynamicCapitalAllocator:
         """
         
         # Calculate metrics
-        total_trades = len(self.active_trades) + len(self.closed_trades)
-        max_possible_trades = int(self.deployment_capital / (self.deployment_capital * (self.per_trade_percentage / 100)))
-        utilization_pct = (self.allocated_capital / self.deployment_capital) * 100 if self.deployment_capital > 0 else 0
+        n_active = self._n_active
+        total_trades = n_active + self._n_closed
+        max_possible_trades = self._max_possible_trades
+        utilization_pct = (self._allocated_paise / self._deployment_paise) * 100 if self._deployment_paise > 0 else 0
         
         # Performance metrics
         total_pnl = sum(trade.get('net_pnl', 0) for trade in self.trade_history)
@@ -438,21 +775,36 @@ class DynamicCapitalAllocator:
             'utilization_percentage': utilization_pct,
             
             # Trading capacity
-            'active_trades': len(self.active_trades),
+            'active_trades': n_active,
             'max_possible_trades': max_possible_trades,
-            'remaining_capacity': max_possible_trades - len(self.active_trades),
-            'per_trade_allocation': self.deployment_capital * (self.per_trade_percentage / 100),
+            'remaining_capacity': max_possible_trades - n_active,
+            'per_trade_allocation': self.per_trade_amount,
             
             # Performance
             'total_trades_executed': total_trades,
-            'trades_closed': len(self.closed_trades),
+            'trades_closed': self._n_closed,
             'total_pnl': total_pnl,
             
             # Validation
             'reserve_untouched': True,  # Always true in this system
-            'capital_buckets_valid': abs((self.deployment_capital + self.reserve_capital) - self.total_capital) < 0.01
+            'capital_buckets_valid': self._buckets_valid
         }
 
+    def get_capital_status_numpy(self) -> np.ndarray:
+        """
+        Get the core capital figures as a float64 array
+        
+        Order: total, deployment, reserve, allocated, available. Lets
+        polling consumers skip the dict build and any string formatting.
+        """
+        return np.array([
+            self.total_capital,
+            self.deployment_capital,
+            self.reserve_capital,
+            self.allocated_capital,
+            self.available_deployment_capital
+        ], dtype=np.float64)
+
     def validate_reserve_protection(self) -> bool:
         """
         Always Maintain the Reserve (Step 6)
@@ -463,11 +815,19 @@ class DynamicCapitalAllocator:
             True if reserve is properly protected, False otherwise
         """
         
-        # Check that we never allocate from reserve
-        total_possible_allocation = self.deployment_capital
+        # Guard the incrementally maintained total against drift (O(open trades))
+        if _DEBUG_CAPITAL:
+            expected = self._trades_soa.active_allocated()
+            if expected != self._allocated_paise:
+                logger.warning(f"⚠️ Allocated capital drifted: ₹{self.allocated_capital:,.2f} "
+                               f"tracked vs ₹{expected / 100:,.2f} actual - resyncing")
+                self._allocated_paise = expected
+                self.track_allocated_capital()
         
-        if self.allocated_capital <= total_possible_allocation:
-            logger.debug("✅ Reserve protection validated")
+        # Check that we never allocate from reserve
+        if self._allocated_paise <= self._deployment_paise:
+            if _DEBUG_CAPITAL:
+                logger.debug("✅ Reserve protection validated")
             return True
         else:
             logger.error("❌ Reserve protection violated!")
@@ -477,24 +837,15 @@ class DynamicCapitalAllocator:
         """Log current capital allocation status"""
         status = self.get_capital_status()
         
-        print(f"\\n📊 DYNAMIC CAPITAL ALLOCATION STATUS")
-        print("=" * 50)
-        print(f"💰 Total Capital:           ₹{status['total_capital']:,.0f}")
-        print(f"📈 Deployment ({status['deployment_percentage']:.0f}%):      ₹{status['deployment_capital']:,.0f}")
-        print(f"🛡️  Reserve ({status['reserve_percentage']:.0f}%):         ₹{status['reserve_capital']:,.0f}")
-        print(f"💼 Allocated:               ₹{status['allocated_capital']:,.0f}")
-        print(f"✅ Available:               ₹{status['available_deployment_capital']:,.0f}")
-        print(f"🎯 Per Trade:               ₹{status['per_trade_allocation']:,.0f}")
-        print(f"📊 Utilization:             {status['utilization_percentage']:.1f}%")
-        print(f"🔢 Active Trades:           {status['active_trades']}")
-        print(f"🏆 Max Capacity:            {status['max_possible_trades']} trades")
-        print(f"📈 Total P&L:               ₹{status['total_pnl']:,.2f}")
-        print()
+        print(_STATUS_REPORT.format(**status))
 
     def simulate_trading_session(self, signals: List[TradeSignal]) -> Dict:
         """
         Simulate a complete trading session with multiple signals
         
+        No trade closes during a session, so all signals are decided in a
+        single pass by process_signal_batch.
+        
         Args:
             signals: List of trade signals to process
             
@@ -506,35 +857,42 @@ class DynamicCapitalAllocator:
         print(f"Processing {len(signals)} signals...")
         print()
         
+        available_before = self.available_deployment_capital
+        active_before = self._n_active
+        per_trade_allocation = self.per_trade_amount
+        
+        # Step 4: decide every signal in one batch
+        executed = self.process_signal_batch(signals)
+        is_buy = [s.signal_type == 'BUY' for s in signals]
+        n = len(signals)
+        k = int(executed.sum())
+        
+        # Validate reserve protection (Step 6)
+        self.validate_reserve_protection()
+        
+        executed_so_far = np.cumsum(executed)
+        for i, signal in enumerate(signals):
+            available = available_before - executed_so_far[i] * per_trade_allocation
+            print(f"Signal {i + 1}: {signal.signal_type} {signal.symbol} @ ₹{signal.price}")
+            if executed[i]:
+                print(f"   ✅ Trade executed: ₹{per_trade_allocation:,.0f} allocated to {signal.symbol}")
+            elif is_buy[i] and per_trade_allocation <= 0:
+                print(f"   ❌ Trade rejected: Per-trade allocation is ₹0")
+            elif is_buy[i]:
+                print(f"   ❌ Trade rejected: Need ₹{per_trade_allocation - available:,.0f} more capital")
+            else:
+                print(f"   ❌ Skipped: Only BUY signals processed here")
+            print(f"   💰 Available: ₹{available:,.0f} | "
+                  f"Active: {active_before + executed_so_far[i]} trades")
+        
         results = {
-            'signals_processed': 0,
-            'trades_executed': 0,
-            'trades_rejected': 0,
+            'signals_processed': n,
+            'trades_executed': k,
+            'trades_rejected': n - k,
             'session_pnl': 0.0
         }
         
-        for i, signal in enumerate(signals, 1):
-            print(f"Signal {i}: {signal.signal_type} {signal.symbol} @ ₹{signal.price}")
-            
-            # Process the signal (Step 4)
-            result = self.process_trade_signal(signal)
-            results['signals_processed'] += 1
-            
-            if result['status'] == 'EXECUTED':
-                results['trades_executed'] += 1
-                print(f"   ✅ {result['message']}")
-            else:
-                results['trades_rejected'] += 1
-                print(f"   ❌ {result['message']}")
-            
-            # Validate reserve protection (Step 6)
-            self.validate_reserve_protection()
-            
-            # Show current status
-            print(f"   💰 Available: ₹{self.available_deployment_capital:,.0f} | "
-                  f"Active: {len(self.active_trades)} trades")
-        
-        print(f"\\n🎯 SESSION COMPLETE")
+        print("\n🎯 SESSION COMPLETE")
         print(f"Signals: {results['signals_processed']} | "
               f"Executed: {results['trades_executed']} | "
               f"Rejected: {results['trades_rejected']}")
@@ -6,12 +6,23 @@ Complete list of Indian ETFs for the trading system with sector classification
 and market data integration capabilities.
 """
 
-from typing import Dict, List, Optional
+from __future__ import annotations
+
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import pandas as pd
+import numpy as np
 from datetime import datetime
-import json
+
+from core.compat import DATACLASS_SLOTS, dumps_indented
+
+if TYPE_CHECKING:
+    # pandas is imported lazily when the database is first built
+    import pandas as pd
 
 class ETFCategory(Enum):
     """ETF categories for better organization"""
@@ -23,9 +34,12 @@ class ETFCategory(Enum):
     INTERNATIONAL = "International"
     FACTOR_BASED = "Factor Based"
 
-@dataclass
+# Category labels in declaration order; the columnar frame stores int8 codes into this
+_CATEGORY_LABELS = tuple(category.value for category in ETFCategory)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ETFInfo:
-    """Complete ETF information"""
+    """Complete ETF information (immutable, hashable)"""
     name: str
     symbol: str
     tracking_index: str
@@ -36,9 +50,105 @@ class ETFInfo:
     min_investment: float = 1000.0  # Minimum investment amount
     
     def __post_init__(self):
-        """Set NSE symbol if not provided"""
+        """Set NSE symbol if not provided (the built-in table always provides it)"""
         if self.nse_symbol is None:
-            self.nse_symbol = f"{self.symbol}.NS"
+            # Frozen dataclass: bypass the generated __setattr__ guard
+            object.__setattr__(self, 'nse_symbol', f"{self.symbol}.NS")
+
+# Static ETF table: (symbol, name, tracking index, category, priority)
+_ETF_ROWS = (
+    # Broad Market ETFs - Priority 1-3 (High Liquidity)
+    ('NIFTYBEES', "Nippon India ETF Nifty 50 BeES", "Nifty 50", ETFCategory.BROAD_MARKET, 1),
+    ('UTISENSETF', "UTI S&P BSE Sensex ETF", "S&P BSE Sensex", ETFCategory.BROAD_MARKET, 2),
+    ('ICICINXT50', "ICICI Prudential Nifty Next 50 ETF", "Nifty Next 50", ETFCategory.BROAD_MARKET, 3),
+    ('SETFNIF100', "SBI ETF Nifty 100", "Nifty 100", ETFCategory.BROAD_MARKET, 3),
+    ('KOTAKNIFTY200', "Kotak Nifty 200 ETF", "Nifty 200", ETFCategory.BROAD_MARKET, 3),
+    ('ABSLNIFTY500ETF', "Aditya Birla Sun Life Nifty 500 ETF", "Nifty 500", ETFCategory.BROAD_MARKET, 3),
+    ('MOM150ETF', "Motilal Oswal Nifty Midcap 150 ETF", "Nifty Midcap 150", ETFCategory.BROAD_MARKET, 4),
+    ('MOM250ETF', "Motilal Oswal Nifty Smallcap 250 ETF", "Nifty Smallcap 250", ETFCategory.BROAD_MARKET, 4),
+    ('MOMMICROETF', "Motilal Oswal Nifty Microcap 250 ETF", "Nifty Microcap 250", ETFCategory.BROAD_MARKET, 5),
+    ('MON100ETF', "Motilal Oswal Nifty 100 ETF", "Nifty 100", ETFCategory.BROAD_MARKET, 3),
+    ('ICICIMID50', "ICICI Prudential Nifty Midcap 150 ETF", "Nifty Midcap 150", ETFCategory.BROAD_MARKET, 4),
+    ('ICICISMALL100', "ICICI Prudential Nifty Smallcap 250 ETF", "Nifty Smallcap 250", ETFCategory.BROAD_MARKET, 4),
+    
+    # Sectoral ETFs - Priority 1-4
+    ('BANKBEES', "Nippon India ETF Nifty Bank BeES", "Nifty Bank", ETFCategory.SECTORAL, 1),
+    ('ITBEES', "Nippon India ETF Nifty IT", "Nifty IT", ETFCategory.SECTORAL, 2),
+    ('PSUBANKBEES', "Nippon India ETF Nifty PSU Bank", "Nifty PSU Bank", ETFCategory.SECTORAL, 3),
+    ('PHARMABEES', "Nippon India ETF Nifty Pharma", "Nifty Pharma", ETFCategory.SECTORAL, 3),
+    ('FMCGBEES', "Nippon India ETF Nifty FMCG", "Nifty FMCG", ETFCategory.SECTORAL, 3),
+    ('ENERGYBEES', "Nippon India ETF Nifty Energy", "Nifty Energy", ETFCategory.SECTORAL, 3),
+    ('AUTOETF', "Nippon India ETF Nifty Auto", "Nifty Auto", ETFCategory.SECTORAL, 3),
+    ('PRBANKETF', "Nippon India ETF Nifty Private Bank", "Nifty Private Bank", ETFCategory.SECTORAL, 3),
+    ('METALETF', "Nippon India ETF Nifty Metal", "Nifty Metal", ETFCategory.SECTORAL, 3),
+    ('INFRAETF', "Nippon India ETF Nifty Infra", "Nifty Infrastructure", ETFCategory.SECTORAL, 4),
+    ('REALTYETF', "Nippon India ETF Nifty Realty", "Nifty Realty", ETFCategory.SECTORAL, 4),
+    ('MEDIAETF', "Nippon India ETF Nifty Media", "Nifty Media", ETFCategory.SECTORAL, 4),
+    ('COMMODETF', "Nippon India ETF Nifty Commodities", "Nifty Commodities", ETFCategory.SECTORAL, 4),
+    ('SERVICESETF', "Nippon India ETF Nifty Services Sector", "Nifty Services Sector", ETFCategory.SECTORAL, 4),
+    ('CONSUMETF', "Nippon India ETF Nifty Consumption", "Nifty Consumption", ETFCategory.SECTORAL, 4),
+    ('ICICIFINSERV', "ICICI Prudential Nifty Financial Services ETF", "Nifty Financial Services", ETFCategory.SECTORAL, 3),
+    ('ICICIHEALTH', "ICICI Prudential Nifty Healthcare ETF", "Nifty Healthcare Index", ETFCategory.SECTORAL, 4),
+    
+    # Thematic ETFs
+    ('DIVOPPBEES', "Nippon India ETF Nifty Dividend Opportunities 50", "Nifty Dividend Opportunities 50", ETFCategory.THEMATIC, 3),
+    ('GROWTHETF', "Nippon India ETF Nifty Growth Sectors 15", "Nifty Growth Sectors 15", ETFCategory.THEMATIC, 4),
+    ('MNCETF', "Nippon India ETF Nifty MNC", "Nifty MNC", ETFCategory.THEMATIC, 4),
+    ('CPSEETF', "Nippon India ETF Nifty CPSE", "Nifty CPSE", ETFCategory.THEMATIC, 4),
+    ('ICICIB22', "ICICI Prudential Bharat 22 ETF", "Bharat 22 Index", ETFCategory.THEMATIC, 3),
+    ('ICICIESGETF', "ICICI Prudential ESG ETF", "Nifty100 ESG Index", ETFCategory.THEMATIC, 4),
+    ('ICICIDIGITAL', "ICICI Prudential Nifty India Digital ETF", "Nifty India Digital Index", ETFCategory.THEMATIC, 4),
+    ('ICICIMANUF', "ICICI Prudential Nifty India Manufacturing ETF", "Nifty India Manufacturing Index", ETFCategory.THEMATIC, 4),
+    ('ICICIHDIV', "ICICI Prudential Nifty Dividend Opportunities 50 ETF", "Nifty Dividend Opportunities 50", ETFCategory.THEMATIC, 4),
+    
+    # Factor Based ETFs
+    ('ALPHALVETF', "Nippon India ETF Nifty Alpha Low-Volatility 30", "Nifty Alpha Low-Volatility 30", ETFCategory.FACTOR_BASED, 4),
+    ('QUALITYETF', "Nippon India ETF Nifty200 Quality 30", "Nifty200 Quality 30", ETFCategory.FACTOR_BASED, 4),
+    ('VALUEETF', "Nippon India ETF Nifty200 Value 30", "Nifty200 Value 30", ETFCategory.FACTOR_BASED, 4),
+    ('LOWVOLETF', "Nippon India ETF Nifty100 Low Volatility 30", "Nifty100 Low Volatility 30", ETFCategory.FACTOR_BASED, 4),
+    ('EQUALWEIGHTETF', "Nippon India ETF Nifty100 Equal Weight", "Nifty100 Equal Weight", ETFCategory.FACTOR_BASED, 4),
+    ('EDELMOM30', "Edelweiss ETF Nifty Momentum 30", "Nifty200 Momentum 30", ETFCategory.FACTOR_BASED, 4),
+    ('ALPHA50ETF', "Edelweiss ETF Nifty Alpha 50", "Nifty Alpha 50", ETFCategory.FACTOR_BASED, 4),
+    
+    # Fixed Income ETFs
+    ('LIQUIDBEES', "Nippon India ETF Nifty 1D Rate Liquid BeES", "Nifty 1D Rate Index", ETFCategory.FIXED_INCOME, 2),
+    ('GS813ETF', "Nippon India ETF Nifty 8-13 Years G-Sec", "Nifty 8-13 Years G-Sec Index", ETFCategory.FIXED_INCOME, 3),
+    ('GS5YEARETF', "SBI ETF 10 Year Gilt", "Nifty 10 yr Benchmark G-Sec Index", ETFCategory.FIXED_INCOME, 4),
+    ('BHARATBONDETFAPR30', "Bharat Bond ETF April 2030", "Nifty Bharat Bond Index April 2030", ETFCategory.FIXED_INCOME, 3),
+    ('BHARATBONDETFAPR25', "Bharat Bond ETF April 2025", "Nifty Bharat Bond Index April 2025", ETFCategory.FIXED_INCOME, 3),
+    ('EDEL1DRATEETF', "Edelweiss ETF Nifty 1D Rate", "Nifty 1D Rate Index", ETFCategory.FIXED_INCOME, 4),
+    ('SBISDL26ETF', "SBI ETF SDL 2026", "Nifty SDL Index 2026", ETFCategory.FIXED_INCOME, 4),
+    ('ICICISDL27ETF', "ICICI Prudential ETF SDL 2027", "Nifty SDL Index 2027", ETFCategory.FIXED_INCOME, 4),
+    ('HDFCGSEC30ETF', "HDFC ETF G-Sec Long Term", "Nifty 15 Yr and above G-Sec Index", ETFCategory.FIXED_INCOME, 4),
+    
+    # Commodity ETFs
+    ('GOLDBEES', "Nippon India ETF Gold BeES", "Gold Price", ETFCategory.COMMODITY, 2),
+    ('SILVERBEES', "Nippon India ETF Silver BeES", "Silver Price", ETFCategory.COMMODITY, 3),
+    
+    # International ETFs
+    ('INDA', "iShares MSCI India ETF", "MSCI India Index", ETFCategory.INTERNATIONAL, 3),
+    ('MOSP500ETF', "Motilal Oswal S&P 500 Index Fund", "S&P 500 Index", ETFCategory.INTERNATIONAL, 3),
+    ('MOEAFEETF', "Motilal Oswal MSCI EAFE Index Fund", "MSCI EAFE Index", ETFCategory.INTERNATIONAL, 4),
+    ('MOEMETF', "Motilal Oswal MSCI Emerging Markets ETF", "MSCI Emerging Markets Index", ETFCategory.INTERNATIONAL, 4),
+)
+
+# Sector -> member ETFs; read-only so every caller can share one object
+_SECTOR_ETFS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Banking': ('BANKBEES', 'PSUBANKBEES', 'PRBANKETF', 'ICICIFINSERV'),
+    'Technology': ('ITBEES', 'ICICIDIGITAL'),
+    'Healthcare': ('PHARMABEES', 'ICICIHEALTH'),
+    'FMCG': ('FMCGBEES',),
+    'Energy': ('ENERGYBEES',),
+    'Auto': ('AUTOETF',),
+    'Metal': ('METALETF',),
+    'Realty': ('REALTYETF',),
+    'Media': ('MEDIAETF',),
+    'Infrastructure': ('INFRAETF',),
+    'Manufacturing': ('ICICIMANUF',),
+    'Services': ('SERVICESETF',),
+    'Consumption': ('CONSUMETF',),
+    'Commodities': ('COMMODETF',)
+})
 
 class IndianETFDatabase:
     """Comprehensive database of Indian ETFs"""
@@ -47,280 +157,68 @@ class IndianETFDatabase:
         """Initialize the ETF database"""
         self.etfs = self._load_etf_data()
         self.categories = self._organize_by_category()
+        self._build_priority_index()
+        self._frame = self._build_frame()
+        # Lowercased symbol/name/index per ETF; NUL-joined so matches can't span fields
+        self._search_blob = [
+            (symbol, "\0".join((symbol, etf_info.name, etf_info.tracking_index)).lower())
+            for symbol, etf_info in self.etfs.items()
+        ]
+        self._json_bytes: Optional[bytes] = None  # serialized export, built on first use
     
     def _load_etf_data(self) -> Dict[str, ETFInfo]:
         """Load complete ETF data with all requested symbols"""
-        etf_data = {
-            # Broad Market ETFs - Priority 1-3 (High Liquidity)
-            'NIFTYBEES': ETFInfo(
-                "Nippon India ETF Nifty 50 BeES", "NIFTYBEES", "Nifty 50",
-                ETFCategory.BROAD_MARKET, priority=1
-            ),
-            'UTISENSETF': ETFInfo(
-                "UTI S&P BSE Sensex ETF", "UTISENSETF", "S&P BSE Sensex",
-                ETFCategory.BROAD_MARKET, priority=2
-            ),
-            'ICICINXT50': ETFInfo(
-                "ICICI Prudential Nifty Next 50 ETF", "ICICINXT50", "Nifty Next 50",
-                ETFCategory.BROAD_MARKET, priority=3
-            ),
-            'SETFNIF100': ETFInfo(
-                "SBI ETF Nifty 100", "SETFNIF100", "Nifty 100",
-                ETFCategory.BROAD_MARKET, priority=3
-            ),
-            'KOTAKNIFTY200': ETFInfo(
-                "Kotak Nifty 200 ETF", "KOTAKNIFTY200", "Nifty 200",
-                ETFCategory.BROAD_MARKET, priority=3
-            ),
-            'ABSLNIFTY500ETF': ETFInfo(
-                "Aditya Birla Sun Life Nifty 500 ETF", "ABSLNIFTY500ETF", "Nifty 500",
-                ETFCategory.BROAD_MARKET, priority=3
-            ),
-            'MOM150ETF': ETFInfo(
-                "Motilal Oswal Nifty Midcap 150 ETF", "MOM150ETF", "Nifty Midcap 150",
-                ETFCategory.BROAD_MARKET, priority=4
-            ),
-            'MOM250ETF': ETFInfo(
-                "Motilal Oswal Nifty Smallcap 250 ETF", "MOM250ETF", "Nifty Smallcap 250",
-                ETFCategory.BROAD_MARKET, priority=4
-            ),
-            'MOMMICROETF': ETFInfo(
-                "Motilal Oswal Nifty Microcap 250 ETF", "MOMMICROETF", "Nifty Microcap 250",
-                ETFCategory.BROAD_MARKET, priority=5
-            ),
-            'MON100ETF': ETFInfo(
-                "Motilal Oswal Nifty 100 ETF", "MON100ETF", "Nifty 100",
-                ETFCategory.BROAD_MARKET, priority=3
-            ),
-            'ICICIMID50': ETFInfo(
-                "ICICI Prudential Nifty Midcap 150 ETF", "ICICIMID50", "Nifty Midcap 150",
-                ETFCategory.BROAD_MARKET, priority=4
-            ),
-            'ICICISMALL100': ETFInfo(
-                "ICICI Prudential Nifty Smallcap 250 ETF", "ICICISMALL100", "Nifty Smallcap 250",
-                ETFCategory.BROAD_MARKET, priority=4
-            ),
-            
-            # Sectoral ETFs - Priority 1-4
-            'BANKBEES': ETFInfo(
-                "Nippon India ETF Nifty Bank BeES", "BANKBEES", "Nifty Bank",
-                ETFCategory.SECTORAL, priority=1
-            ),
-            'ITBEES': ETFInfo(
-                "Nippon India ETF Nifty IT", "ITBEES", "Nifty IT",
-                ETFCategory.SECTORAL, priority=2
-            ),
-            'PSUBANKBEES': ETFInfo(
-                "Nippon India ETF Nifty PSU Bank", "PSUBANKBEES", "Nifty PSU Bank",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'PHARMABEES': ETFInfo(
-                "Nippon India ETF Nifty Pharma", "PHARMABEES", "Nifty Pharma",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'FMCGBEES': ETFInfo(
-                "Nippon India ETF Nifty FMCG", "FMCGBEES", "Nifty FMCG",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'ENERGYBEES': ETFInfo(
-                "Nippon India ETF Nifty Energy", "ENERGYBEES", "Nifty Energy",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'AUTOETF': ETFInfo(
-                "Nippon India ETF Nifty Auto", "AUTOETF", "Nifty Auto",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'PRBANKETF': ETFInfo(
-                "Nippon India ETF Nifty Private Bank", "PRBANKETF", "Nifty Private Bank",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'METALETF': ETFInfo(
-                "Nippon India ETF Nifty Metal", "METALETF", "Nifty Metal",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'INFRAETF': ETFInfo(
-                "Nippon India ETF Nifty Infra", "INFRAETF", "Nifty Infrastructure",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            'REALTYETF': ETFInfo(
-                "Nippon India ETF Nifty Realty", "REALTYETF", "Nifty Realty",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            'MEDIAETF': ETFInfo(
-                "Nippon India ETF Nifty Media", "MEDIAETF", "Nifty Media",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            'COMMODETF': ETFInfo(
-                "Nippon India ETF Nifty Commodities", "COMMODETF", "Nifty Commodities",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            'SERVICESETF': ETFInfo(
-                "Nippon India ETF Nifty Services Sector", "SERVICESETF", "Nifty Services Sector",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            'CONSUMETF': ETFInfo(
-                "Nippon India ETF Nifty Consumption", "CONSUMETF", "Nifty Consumption",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            'ICICIFINSERV': ETFInfo(
-                "ICICI Prudential Nifty Financial Services ETF", "ICICIFINSERV", "Nifty Financial Services",
-                ETFCategory.SECTORAL, priority=3
-            ),
-            'ICICIHEALTH': ETFInfo(
-                "ICICI Prudential Nifty Healthcare ETF", "ICICIHEALTH", "Nifty Healthcare Index",
-                ETFCategory.SECTORAL, priority=4
-            ),
-            
-            # Thematic ETFs
-            'DIVOPPBEES': ETFInfo(
-                "Nippon India ETF Nifty Dividend Opportunities 50", "DIVOPPBEES", "Nifty Dividend Opportunities 50",
-                ETFCategory.THEMATIC, priority=3
-            ),
-            'GROWTHETF': ETFInfo(
-                "Nippon India ETF Nifty Growth Sectors 15", "GROWTHETF", "Nifty Growth Sectors 15",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            'MNCETF': ETFInfo(
-                "Nippon India ETF Nifty MNC", "MNCETF", "Nifty MNC",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            'CPSEETF': ETFInfo(
-                "Nippon India ETF Nifty CPSE", "CPSEETF", "Nifty CPSE",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            'ICICIB22': ETFInfo(
-                "ICICI Prudential Bharat 22 ETF", "ICICIB22", "Bharat 22 Index",
-                ETFCategory.THEMATIC, priority=3
-            ),
-            'ICICIESGETF': ETFInfo(
-                "ICICI Prudential ESG ETF", "ICICIESGETF", "Nifty100 ESG Index",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            'ICICIDIGITAL': ETFInfo(
-                "ICICI Prudential Nifty India Digital ETF", "ICICIDIGITAL", "Nifty India Digital Index",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            'ICICIMANUF': ETFInfo(
-                "ICICI Prudential Nifty India Manufacturing ETF", "ICICIMANUF", "Nifty India Manufacturing Index",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            'ICICIHDIV': ETFInfo(
-                "ICICI Prudential Nifty Dividend Opportunities 50 ETF", "ICICIHDIV", "Nifty Dividend Opportunities 50",
-                ETFCategory.THEMATIC, priority=4
-            ),
-            
-            # Factor Based ETFs
-            'ALPHALVETF': ETFInfo(
-                "Nippon India ETF Nifty Alpha Low-Volatility 30", "ALPHALVETF", "Nifty Alpha Low-Volatility 30",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            'QUALITYETF': ETFInfo(
-                "Nippon India ETF Nifty200 Quality 30", "QUALITYETF", "Nifty200 Quality 30",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            'VALUEETF': ETFInfo(
-                "Nippon India ETF Nifty200 Value 30", "VALUEETF", "Nifty200 Value 30",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            'LOWVOLETF': ETFInfo(
-                "Nippon India ETF Nifty100 Low Volatility 30", "LOWVOLETF", "Nifty100 Low Volatility 30",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            'EQUALWEIGHTETF': ETFInfo(
-                "Nippon India ETF Nifty100 Equal Weight", "EQUALWEIGHTETF", "Nifty100 Equal Weight",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            'EDELMOM30': ETFInfo(
-                "Edelweiss ETF Nifty Momentum 30", "EDELMOM30", "Nifty200 Momentum 30",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            'ALPHA50ETF': ETFInfo(
-                "Edelweiss ETF Nifty Alpha 50", "ALPHA50ETF", "Nifty Alpha 50",
-                ETFCategory.FACTOR_BASED, priority=4
-            ),
-            
-            # Fixed Income ETFs
-            'LIQUIDBEES': ETFInfo(
-                "Nippon India ETF Nifty 1D Rate Liquid BeES", "LIQUIDBEES", "Nifty 1D Rate Index",
-                ETFCategory.FIXED_INCOME, priority=2
-            ),
-            'GS813ETF': ETFInfo(
-                "Nippon India ETF Nifty 8-13 Years G-Sec", "GS813ETF", "Nifty 8-13 Years G-Sec Index",
-                ETFCategory.FIXED_INCOME, priority=3
-            ),
-            'GS5YEARETF': ETFInfo(
-                "SBI ETF 10 Year Gilt", "GS5YEARETF", "Nifty 10 yr Benchmark G-Sec Index",
-                ETFCategory.FIXED_INCOME, priority=4
-            ),
-            'BHARATBONDETFAPR30': ETFInfo(
-                "Bharat Bond ETF April 2030", "BHARATBONDETFAPR30", "Nifty Bharat Bond Index April 2030",
-                ETFCategory.FIXED_INCOME, priority=3
-            ),
-            'BHARATBONDETFAPR25': ETFInfo(
-                "Bharat Bond ETF April 2025", "BHARATBONDETFAPR25", "Nifty Bharat Bond Index April 2025",
-                ETFCategory.FIXED_INCOME, priority=3
-            ),
-            'EDEL1DRATEETF': ETFInfo(
-                "Edelweiss ETF Nifty 1D Rate", "EDEL1DRATEETF", "Nifty 1D Rate Index", 
-                ETFCategory.FIXED_INCOME, priority=4
-            ),
-            'SBISDL26ETF': ETFInfo(
-                "SBI ETF SDL 2026", "SBISDL26ETF", "Nifty SDL Index 2026",
-                ETFCategory.FIXED_INCOME, priority=4
-            ),
-            'ICICISDL27ETF': ETFInfo(
-                "ICICI Prudential ETF SDL 2027", "ICICISDL27ETF", "Nifty SDL Index 2027",
-                ETFCategory.FIXED_INCOME, priority=4
-            ),
-            'HDFCGSEC30ETF': ETFInfo(
-                "HDFC ETF G-Sec Long Term", "HDFCGSEC30ETF", "Nifty 15 Yr and above G-Sec Index",
-                ETFCategory.FIXED_INCOME, priority=4
-            ),
-            
-            # Commodity ETFs
-            'GOLDBEES': ETFInfo(
-                "Nippon India ETF Gold BeES", "GOLDBEES", "Gold Price",
-                ETFCategory.COMMODITY, priority=2
-            ),
-            'SILVERBEES': ETFInfo(
-                "Nippon India ETF Silver BeES", "SILVERBEES", "Silver Price",
-                ETFCategory.COMMODITY, priority=3
-            ),
-            
-            # International ETFs
-            'INDA': ETFInfo(
-                "iShares MSCI India ETF", "INDA", "MSCI India Index",
-                ETFCategory.INTERNATIONAL, priority=3
-            ),
-            'MOSP500ETF': ETFInfo(
-                "Motilal Oswal S&P 500 Index Fund", "MOSP500ETF", "S&P 500 Index",
-                ETFCategory.INTERNATIONAL, priority=3
-            ),
-            'MOEAFEETF': ETFInfo(
-                "Motilal Oswal MSCI EAFE Index Fund", "MOEAFEETF", "MSCI EAFE Index",
-                ETFCategory.INTERNATIONAL, priority=4
-            ),
-            'MOEMETF': ETFInfo(
-                "Motilal Oswal MSCI Emerging Markets ETF", "MOEMETF", "MSCI Emerging Markets Index",
-                ETFCategory.INTERNATIONAL, priority=4
+        # Intern free-text fields so equal names/indices share one object process-wide
+        intern = sys.intern
+        return {
+            symbol: ETFInfo(
+                intern(name), symbol, intern(tracking_index), category,
+                nse_symbol=f"{symbol}.NS", priority=priority
             )
+            for symbol, name, tracking_index, category, priority in _ETF_ROWS
         }
-        
-        return etf_data
     
     def _organize_by_category(self) -> Dict[ETFCategory, List[str]]:
         """Organize ETFs by category"""
-        categories = {}
+        # Preallocate one bucket per category in first-appearance order, so the
+        # fill loop needs no membership test and only populated categories exist
+        categories = {category: [] for category in dict.fromkeys(
+            etf_info.category for etf_info in self.etfs.values()
+        )}
         for symbol, etf_info in self.etfs.items():
-            category = etf_info.category
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(symbol)
+            categories[etf_info.category].append(symbol)
         return categories
     
+    def _build_priority_index(self):
+        """Pre-sort active ETFs by priority so liquidity queries are a prefix slice"""
+        by_priority = sorted(
+            (etf_info for etf_info in self.etfs.values() if etf_info.is_active),
+            key=lambda e: e.priority
+        )
+        self._by_priority = [etf_info.symbol for etf_info in by_priority]
+        self._priorities = [etf_info.priority for etf_info in by_priority]
+    
+    def _build_frame(self) -> pd.DataFrame:
+        """Columnar (SoA) view of the table, built once for vectorized queries"""
+        import pandas as pd
+        
+        etfs = list(self.etfs.values())
+        return pd.DataFrame({
+            'Symbol': [e.symbol for e in etfs],
+            'Name': [e.name for e in etfs],
+            'Category': pd.Categorical([e.category.value for e in etfs], categories=_CATEGORY_LABELS),
+            'NSE_Symbol': [e.nse_symbol for e in etfs],
+            'Priority': np.fromiter((e.priority for e in etfs), dtype=np.int8, count=len(etfs)),
+            'Is_Active': np.fromiter((e.is_active for e in etfs), dtype=np.bool_, count=len(etfs))
+        }, index=list(self.etfs.keys()))
+    
     def get_etf_by_symbol(self, symbol: str) -> Optional[ETFInfo]:
         """Get ETF information by symbol"""
-        return self.etfs.get(symbol.upper())
+        # Keys are uppercase, so try the symbol as given before normalizing
+        etf_info = self.etfs.get(symbol)
+        if etf_info is None:
+            etf_info = self.etfs.get(symbol.upper())
+        return etf_info
     
     def get_all_symbols(self) -> List[str]:
         """Get all ETF symbols"""
@@ -332,13 +230,8 @@ class IndianETFDatabase:
     
     def get_high_priority_etfs(self, max_priority: int = 3) -> List[str]:
         """Get high priority ETFs for active trading"""
-        high_priority = []
-        for symbol, etf_info in self.etfs.items():
-            if etf_info.priority <= max_priority and etf_info.is_active:
-                high_priority.append(symbol)
-        # Sort by priority
-        high_priority.sort(key=lambda s: self.etfs[s].priority)
-        return high_priority
+        # Prefix of the pre-sorted list; slicing hands back a fresh copy
+        return self._by_priority[:bisect_right(self._priorities, max_priority)]
     
     def get_liquid_etfs(self, liquidity_level: str = 'HIGH') -> List[str]:
         """Get ETFs by liquidity level"""
@@ -349,121 +242,120 @@ class IndianETFDatabase:
         else:
             return self.get_all_symbols()
     
-    def get_sector_etfs(self) -> Dict[str, List[str]]:
-        """Get ETFs organized by sector"""
-        return {
-            'Banking': ['BANKBEES', 'PSUBANKBEES', 'PRBANKETF', 'ICICIFINSERV'],
-            'Technology': ['ITBEES', 'ICICIDIGITAL'],
-            'Healthcare': ['PHARMABEES', 'ICICIHEALTH'],
-            'FMCG': ['FMCGBEES'],
-            'Energy': ['ENERGYBEES'],
-            'Auto': ['AUTOETF'],
-            'Metal': ['METALETF'],
-            'Realty': ['REALTYETF'],
-            'Media': ['MEDIAETF'],
-            'Infrastructure': ['INFRAETF'],
-            'Manufacturing': ['ICICIMANUF'],
-            'Services': ['SERVICESETF'],
-            'Consumption': ['CONSUMETF'],
-            'Commodities': ['COMMODETF']
-        }
+    def get_sector_etfs(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get ETFs organized by sector (shared read-only mapping)"""
+        return _SECTOR_ETFS
     
     def search_etfs(self, query: str) -> List[str]:
         """Search ETFs by name or symbol"""
-        results = []
         query_lower = query.lower()
-        
-        for symbol, etf_info in self.etfs.items():
-            if (query_lower in symbol.lower() or 
-                query_lower in etf_info.name.lower() or
-                query_lower in etf_info.tracking_index.lower()):
-                results.append(symbol)
-        
-        return results
+        return [symbol for symbol, blob in self._search_blob if query_lower in blob]
     
     def export_to_json(self, filename: str = "indian_etf_database.json") -> str:
         """Export ETF database to JSON"""
-        export_data = {}
-        for symbol, etf_info in self.etfs.items():
-            export_data[symbol] = {
-                'name': etf_info.name,
-                'symbol': etf_info.symbol,
-                'tracking_index': etf_info.tracking_index,
-                'category': etf_info.category.value,
-                'nse_symbol': etf_info.nse_symbol,
-                'priority': etf_info.priority,
-                'is_active': etf_info.is_active,
-                'min_investment': etf_info.min_investment
-            }
+        # The table is static after init, so serialize once and reuse the bytes
+        if self._json_bytes is None:
+            export_data = {}
+            for symbol, etf_info in self.etfs.items():
+                export_data[symbol] = {
+                    'name': etf_info.name,
+                    'symbol': etf_info.symbol,
+                    'tracking_index': etf_info.tracking_index,
+                    'category': etf_info.category.value,
+                    'nse_symbol': etf_info.nse_symbol,
+                    'priority': etf_info.priority,
+                    'is_active': etf_info.is_active,
+                    'min_investment': etf_info.min_investment
+                }
+            
+            self._json_bytes = dumps_indented(export_data)
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(self._json_bytes)
         
         print(f"ETF database exported to {filename}")
         return filename
     
     def get_market_data_batch(self, symbols: List[str] = None) -> pd.DataFrame:
         """Get market data for multiple ETFs (placeholder for Kite API integration)"""
-        if symbols is None:
-            # Get high and medium liquidity ETFs for better coverage
-            high_liquid = self.get_liquid_etfs('HIGH')
-            medium_liquid = self.get_liquid_etfs('MEDIUM')
-            symbols = high_liquid + medium_liquid
+        import pandas as pd
         
-        market_data = []
+        if symbols is None:
+            # High and medium liquidity ETFs; MEDIUM (priority <= 4) already includes HIGH
+            symbols = self.get_liquid_etfs('MEDIUM')
         
-        # Create placeholder data for the requested symbols
-        for symbol in symbols:
-            etf = self.get_etf_by_symbol(symbol)
-            if etf and etf.is_active:
-                market_data.append({
-                    'Symbol': symbol,
-                    'Name': etf.name,
-                    'Category': etf.category.value,
-                    'NSE_Symbol': etf.nse_symbol,
-                    'Priority': etf.priority,
-                    'Price': 0.0,  # To be filled by Kite API
-                    'Change %': 0.0,  # To be filled by Kite API
-                    'Volume': 0,  # To be filled by Kite API
-                    'Status': '⚪'  # To be updated based on data availability
-                })
+        # Slice the prebuilt columnar frame instead of building per-row dicts,
+        # remembering each symbol as the caller spelled it
+        requested = [(symbol, symbol.upper()) for symbol in symbols]
+        requested = [(symbol, key) for symbol, key in requested if key in self.etfs]
+        rows = self._frame.loc[[key for _, key in requested]]
+        active = rows['Is_Active'].to_numpy()
+        rows = rows[active]
+        n = len(rows)
         
-        return pd.DataFrame(market_data)
+        # One constructor call from typed column buffers; Priority is widened
+        # back from the frame's int8 storage so the output dtype stays int64
+        return pd.DataFrame({
+            'Symbol': np.array([symbol for symbol, _ in requested], dtype=object)[active],
+            'Name': rows['Name'].to_numpy(),
+            'Category': rows['Category'].to_numpy(),
+            'NSE_Symbol': rows['NSE_Symbol'].to_numpy(),
+            'Priority': rows['Priority'].to_numpy(dtype=np.int64),
+            'Price': np.zeros(n),  # To be filled by Kite API
+            'Change %': np.zeros(n),  # To be filled by Kite API
+            'Volume': np.zeros(n, dtype=np.int64),  # To be filled by Kite API
+            'Status': ['⚪'] * n  # To be updated based on data availability
+        })
     
     def print_database_summary(self):
         """Print summary of ETF database"""
-        print(f"🏦 INDIAN ETF DATABASE SUMMARY")
-        print("=" * 50)
-        print(f"Total ETFs: {len(self.etfs)}")
+        # Collect every line and emit with a single write
+        lines = [
+            f"🏦 INDIAN ETF DATABASE SUMMARY",
+            "=" * 50,
+            f"Total ETFs: {len(self.etfs)}"
+        ]
         
         for category, symbols in self.categories.items():
-            print(f"{category.value}: {len(symbols)} ETFs")
+            lines.append(f"{category.value}: {len(symbols)} ETFs")
             
-        print(f"\n📈 High Priority ETFs for Active Trading:")
+        lines.append(f"\n📈 High Priority ETFs for Active Trading:")
         high_liquid = self.get_liquid_etfs('HIGH')
         for symbol in high_liquid:
             if symbol in self.etfs:
                 etf = self.etfs[symbol]
-                print(f"  {symbol}: {etf.name} (Priority: {etf.priority})")
+                lines.append(f"  {symbol}: {etf.name} (Priority: {etf.priority})")
         
-        print(f"\n📊 Medium Priority ETFs (Total: {len(self.get_liquid_etfs('MEDIUM'))}):")
         medium_liquid = self.get_liquid_etfs('MEDIUM')
+        lines.append(f"\n📊 Medium Priority ETFs (Total: {len(medium_liquid)}):")
         for symbol in medium_liquid[:10]:  # Show first 10
             if symbol in self.etfs:
                 etf = self.etfs[symbol]
-                print(f"  {symbol}: {etf.name} (Priority: {etf.priority})")
+                lines.append(f"  {symbol}: {etf.name} (Priority: {etf.priority})")
         if len(medium_liquid) > 10:
-            print(f"  ... and {len(medium_liquid) - 10} more medium priority ETFs")
+            lines.append(f"  ... and {len(medium_liquid) - 10} more medium priority ETFs")
         
-        print(f"\n🏭 Sector Distribution:")
+        lines.append(f"\n🏭 Sector Distribution:")
         sectors = self.get_sector_etfs()
         for sector, symbols in sectors.items():
-            print(f"  {sector}: {len(symbols)} ETFs")
+            lines.append(f"  {sector}: {len(symbols)} ETFs")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
-# Create global instance
-etf_db = IndianETFDatabase()
+@lru_cache(maxsize=None)
+def get_etf_db() -> IndianETFDatabase:
+    """Shared database instance, built on first use"""
+    return IndianETFDatabase()
+
+def __getattr__(name: str):
+    """Build the global `etf_db` lazily so importing ETFCategory/ETFInfo stays cheap"""
+    if name == 'etf_db':
+        return get_etf_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
+    etf_db = get_etf_db()
+    
     print("🏦 INDIAN ETF DATABASE")
     print("=" * 40)
     
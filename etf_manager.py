@@ -3,6 +3,7 @@ Turtle Trader - ETF Order Management
 Specialized order handling for ETF trading with MTF and CNC order types
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from dataclasses import dataclass
@@ -36,6 +37,21 @@ class ETFOrderRequest:
     validity: str = "DAY"
     disclosed_quantity: int = 0
 
+# ETF category allocation strategy: category -> (weight, member ETFs)
+_ETF_CATEGORY_ALLOCATION = {
+    'BROAD_MARKET': (0.40, ['NIFTYBEES', 'JUNIORBEES', 'NETF']),
+    'SECTOR': (0.30, ['BANKBEES', 'ITBEES', 'PHARMBEES']),
+    'THEMATIC': (0.20, ['GOLDBEES', 'LIQUIDBEES']),
+    'SPECIALTY': (0.10, ['PSUBANK', 'CPSE'])
+}
+
+# Flattened per-ETF share of total capital, built once at import
+_ETF_ALLOCATION_WEIGHTS = {
+    etf: weight / len(etfs)
+    for weight, etfs in _ETF_CATEGORY_ALLOCATION.values()
+    for etf in etfs
+}
+
 class ETFOrderManager:
     """Specialized order manager for ETF trading"""
     
@@ -43,11 +59,18 @@ class ETFOrderManager:
         self.default_order_type = ETFOrderType(config.get("TRADING", "DEFAULT_ORDER_TYPE", "CNC"))
         self.mtf_margin_multiplier = config.getfloat("TRADING", "MTF_MARGIN_MULTIPLIER", 4.0)
         self.max_positions = config.getint("TRADING", "MAX_POSITIONS", 8)
+        self.position_size_fraction = config.getfloat("TRADING", "POSITION_SIZE_PERCENT", 3.0) / 100
         
         # ETF-specific configuration
         self.etf_symbols = self._load_etf_symbols()
         self.etf_lot_sizes = self._get_etf_lot_sizes()
         
+        # Quote fetches are network-bound; created lazily on first use
+        self._quote_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Shared balance manager so its balance cache serves repeat sizing calls
+        self._balance_manager = None
+        
         logger.info(f"ETF Order Manager initialized with {len(self.etf_symbols)} ETF symbols")
     
     def _load_etf_symbols(self) -> List[str]:
@@ -86,10 +109,9 @@ class ETFOrderManager:
         """Calculate optimal position size for ETF"""
         
         available_capital = self._get_available_capital()
-        position_size_percent = config.getfloat("TRADING", "POSITION_SIZE_PERCENT", 3.0) / 100
         
         # Calculate base position size
-        base_allocation = available_capital * position_size_percent
+        base_allocation = available_capital * self.position_size_fraction
         
         # Adjust for order type
         if order_type == ETFOrderType.MTF:
@@ -240,18 +262,35 @@ class ETFOrderManager:
             logger.error(f"Error getting ETF positions: {e}")
             return []
     
+    @staticmethod
+    def _fetch_quote(symbol: str) -> Dict:
+        """Fetch one NSE quote (runs on the quote pool)"""
+        return api_client.get_quotes(stock_code=symbol, exchange_code="NSE")
+    
+    def shutdown(self):
+        """Release the quote pool; it is recreated on the next market data call"""
+        if self._quote_pool is not None:
+            self._quote_pool.shutdown(wait=False, cancel_futures=True)
+            self._quote_pool = None
+    
     def get_etf_market_data(self) -> Dict[str, Dict]:
         """Get real-time market data for all ETFs"""
         
         market_data = {}
         
-        for symbol in self.etf_symbols:
+        if self._quote_pool is None:
+            self._quote_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='etf-quote')
+        
+        # Issue every quote request up front, then collect in symbol order;
+        # the client lookup runs inside each task so a failure stays per symbol
+        futures = [
+            (symbol, self._quote_pool.submit(self._fetch_quote, symbol))
+            for symbol in self.etf_symbols
+        ]
+        
+        for symbol, future in futures:
             try:
-                # Get quotes
-                quote = api_client.get_quotes(
-                    stock_code=symbol,
-                    exchange_code="NSE"
-                )
+                quote = future.result()
                 
                 if quote and 'Success' in quote:
                     market_data[symbol] = {
@@ -329,46 +368,19 @@ class ETFOrderManager:
     
     def calculate_etf_allocation(self, total_capital: float) -> Dict[str, float]:
         """Calculate optimal ETF allocation across different categories"""
-        
-        # ETF category allocation strategy
-        etf_categories = {
-            'BROAD_MARKET': ['NIFTYBEES', 'JUNIORBEES', 'NETF'],  # 40%
-            'SECTOR': ['BANKBEES', 'ITBEES', 'PHARMBEES'],        # 30%
-            'THEMATIC': ['GOLDBEES', 'LIQUIDBEES'],               # 20%
-            'SPECIALTY': ['PSUBANK', 'CPSE']                      # 10%
-        }
-        
-        category_allocation = {
-            'BROAD_MARKET': 0.40,
-            'SECTOR': 0.30,
-            'THEMATIC': 0.20,
-            'SPECIALTY': 0.10
-        }
-        
-        allocation = {}
-        
-        for category, weight in category_allocation.items():
-            category_capital = total_capital * weight
-            etfs_in_category = etf_categories.get(category, [])
-            
-            if etfs_in_category:
-                per_etf_allocation = category_capital / len(etfs_in_category)
-                
-                for etf in etfs_in_category:
-                    allocation[etf] = per_etf_allocation
-        
-        return allocation
+        return {etf: total_capital * weight for etf, weight in _ETF_ALLOCATION_WEIGHTS.items()}
     
     def _get_available_capital(self) -> float:
         """Get available capital from real broker account balance only"""
         
         try:
             # Use RealAccountBalanceManager for accurate balance
-            from real_account_balance import RealAccountBalanceManager
-            balance_manager = RealAccountBalanceManager()
+            if self._balance_manager is None:
+                from real_account_balance import RealAccountBalanceManager
+                self._balance_manager = RealAccountBalanceManager()
             
-            # Get real account balance
-            balance = balance_manager.get_current_balance()
+            # Get real account balance (cached by the manager between refreshes)
+            balance = self._balance_manager.get_current_balance()
             
             if balance:
                 logger.info(f"💰 Real Account Balance: ₹{balance.free_cash:,.2f}")
@@ -3,21 +3,25 @@ ETF Market Data Integration
 Fetches live and historical data for all ETFs using Kite API
 """
 
+import time
+from functools import lru_cache
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
-from etf_database import etf_db
-from kite_api_client import KiteAPIClient
+from etf_database import get_etf_db
+from kite_api_client import get_kite_client
 from core.config import get_config
 
 class ETFMarketDataManager:
     """Manages live and historical data for all ETFs"""
     
     def __init__(self):
-        self.etf_db = etf_db
+        self.etf_db = get_etf_db()
         self.kite_client = None
+        self.price_cache_ttl = 5.0  # seconds
+        self._price_cache: Dict[str, Tuple[float, float]] = {}  # symbol -> (monotonic time, ltp)
         self._init_kite_client()
         
     def _init_kite_client(self):
@@ -28,7 +32,8 @@ class ETFMarketDataManager:
             access_token = config.get('KITE_API', 'access_token')
             
             if api_key and access_token:
-                self.kite_client = KiteAPIClient(api_key, access_token)
+                # Share the process-wide client (and its HTTP session)
+                self.kite_client = get_kite_client()
                 logger.info("ETF Market Data Manager initialized with Kite API")
             else:
                 logger.error("Kite API credentials not found")
@@ -46,21 +51,40 @@ class ETFMarketDataManager:
             symbols = self.etf_db.get_high_priority_etfs(3)
         
         try:
-            # Get LTP data from Kite API
-            ltp_data = self.kite_client.get_ltp(symbols)
+            # Serve fresh prices from the TTL cache; only stale symbols hit Kite
+            now = time.monotonic()
+            ttl = self.price_cache_ttl
+            price_cache = self._price_cache
+            ltp_data = {}
+            stale = []
+            for symbol in symbols:
+                cached = price_cache.get(symbol)
+                if cached is not None and now - cached[0] < ttl:
+                    ltp_data[symbol] = cached[1]
+                else:
+                    stale.append(symbol)
+            
+            if stale:
+                # Get LTP data from Kite API
+                fetched = self.kite_client.get_ltp(stale)
+                for symbol, price in fetched.items():
+                    price_cache[symbol] = (now, price)
+                ltp_data.update(fetched)
             
             result = {}
+            get_etf = self.etf_db.get_etf_by_symbol
             for symbol in symbols:
-                etf_info = self.etf_db.get_etf_by_symbol(symbol)
-                if etf_info and symbol in ltp_data:
+                etf_info = get_etf(symbol)
+                price = ltp_data.get(symbol)  # one lookup instead of membership test + two reads
+                if etf_info and price is not None:
                     result[symbol] = {
                         'name': etf_info.name,
                         'category': etf_info.category.value,
-                        'price': ltp_data[symbol],
+                        'price': price,
                         'priority': etf_info.priority,
                         'nse_symbol': etf_info.nse_symbol,
                         'tracking_index': etf_info.tracking_index,
-                        'status': 'LIVE' if ltp_data[symbol] > 0 else 'NO_DATA'
+                        'status': 'LIVE' if price > 0 else 'NO_DATA'
                     }
                 else:
                     result[symbol] = {
@@ -80,26 +104,31 @@ class ETFMarketDataManager:
             logger.error(f"Failed to get live prices: {e}")
             return {}
     
+    @staticmethod
+    def _live_frame(symbols: List[str], live_data: Dict[str, Dict],
+                    columns: Dict[str, str]) -> pd.DataFrame:
+        """Build a DataFrame column-wise from live price dicts, one constructor call"""
+        rows = [live_data[symbol] for symbol in symbols]
+        frame = {'Symbol': symbols}
+        for column, key in columns.items():
+            frame[column] = [row[key] for row in rows]
+        return pd.DataFrame(frame)
+    
     def get_all_etfs_live_data(self) -> pd.DataFrame:
         """Get live data for all ETFs as a DataFrame"""
         all_symbols = self.etf_db.get_all_symbols()
         live_data = self.get_live_prices(all_symbols)
         
         # Convert to DataFrame
-        rows = []
-        for symbol, data in live_data.items():
-            rows.append({
-                'Symbol': symbol,
-                'Name': data['name'],
-                'Category': data['category'],
-                'Price': data['price'],
-                'Priority': data['priority'],
-                'Status': data['status'],
-                'NSE_Symbol': data['nse_symbol'],
-                'Tracking_Index': data['tracking_index']
-            })
-        
-        df = pd.DataFrame(rows)
+        df = self._live_frame(list(live_data), live_data, {
+            'Name': 'name',
+            'Category': 'category',
+            'Price': 'price',
+            'Priority': 'priority',
+            'Status': 'status',
+            'NSE_Symbol': 'nse_symbol',
+            'Tracking_Index': 'tracking_index'
+        })
         if not df.empty:
             # Sort by priority and then by category
             df = df.sort_values(['Priority', 'Category', 'Symbol'])
@@ -112,18 +141,13 @@ class ETFMarketDataManager:
         live_data = self.get_live_prices(high_priority)
         
         # Convert to DataFrame
-        rows = []
-        for symbol, data in live_data.items():
-            rows.append({
-                'Symbol': symbol,
-                'Name': data['name'],
-                'Category': data['category'],
-                'Price': data['price'],
-                'Priority': data['priority'],
-                'Status': data['status']
-            })
-        
-        df = pd.DataFrame(rows)
+        df = self._live_frame(list(live_data), live_data, {
+            'Name': 'name',
+            'Category': 'category',
+            'Price': 'price',
+            'Priority': 'priority',
+            'Status': 'status'
+        })
         if not df.empty:
             df = df.sort_values(['Priority', 'Symbol'])
         
@@ -134,18 +158,18 @@ class ETFMarketDataManager:
         sectors = self.etf_db.get_sector_etfs()
         sector_data = {}
         
+        # One LTP round-trip for every sector's ETFs instead of one per sector
+        all_symbols = list(dict.fromkeys(symbol for symbols in sectors.values() for symbol in symbols))
+        live_data = self.get_live_prices(all_symbols) if all_symbols else {}
+        
         for sector, symbols in sectors.items():
             if symbols:  # Only process sectors that have ETFs
-                live_data = self.get_live_prices(symbols)
-                rows = []
-                for symbol, data in live_data.items():
-                    rows.append({
-                        'Symbol': symbol,
-                        'Name': data['name'],
-                        'Price': data['price'],
-                        'Status': data['status']
-                    })
-                sector_data[sector] = pd.DataFrame(rows)
+                priced = [symbol for symbol in symbols if symbol in live_data]
+                sector_data[sector] = self._live_frame(priced, live_data, {
+                    'Name': 'name',
+                    'Price': 'price',
+                    'Status': 'status'
+                })
         
         return sector_data
     
@@ -196,14 +220,24 @@ class ETFMarketDataManager:
             logger.error(f"Failed to generate ETF summary: {e}")
             return {}
 
-# Create global instance
-etf_market_data = ETFMarketDataManager()
+@lru_cache(maxsize=None)
+def get_etf_market_data() -> ETFMarketDataManager:
+    """Shared market data manager, created on first use"""
+    return ETFMarketDataManager()
+
+def __getattr__(name: str):
+    """Create the global `etf_market_data` lazily instead of at import time"""
+    if name == 'etf_market_data':
+        return get_etf_market_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Test the market data manager
     print("🏦 ETF MARKET DATA MANAGER")
     print("=" * 40)
     
+    etf_market_data = get_etf_market_data()
+    
     # Get summary
     summary = etf_market_data.get_etf_summary()
     if summary:
@@ -4,15 +4,14 @@ Specialized strategies for ETF trading with momentum and mean reversion
 """
 
 import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
 from etf_manager import etf_order_manager, ETFOrderType, ETFOrderRequest
+from core.compat import DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ETFSignal:
     """ETF trading signal"""
     symbol: str
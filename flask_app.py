@@ -8,14 +8,11 @@ Supports manual token configuration and live trading.
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
 import json
-import os
-from datetime import datetime, timedelta
 import configparser
 from werkzeug.security import generate_password_hash, check_password_hash
 import pandas as pd
 import plotly
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.utils import PlotlyJSONEncoder
 
 # Import your trading modules
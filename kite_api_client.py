@@ -3,9 +3,7 @@ KITE API CLIENT - PRODUCTION READY
 Clean Kite API client for real data only
 """
 
-import json
-import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from kiteconnect import KiteConnect
@@ -93,8 +91,7 @@ class KiteAPIClient:
             ltp_data = self.kite.ltp(formatted_symbols)
             
             result = {}
-            for symbol in symbols:
-                nse_symbol = f"NSE:{symbol}"
+            for symbol, nse_symbol in zip(symbols, formatted_symbols):
                 if nse_symbol in ltp_data and 'last_price' in ltp_data[nse_symbol]:
                     result[symbol] = ltp_data[nse_symbol]['last_price']
                 else:
@@ -134,8 +131,7 @@ class KiteAPIClient:
             quote_data = self.kite.quote(formatted_symbols)
             
             result = {}
-            for symbol in symbols:
-                nse_symbol = f"NSE:{symbol}"
+            for symbol, nse_symbol in zip(symbols, formatted_symbols):
                 if nse_symbol in quote_data:
                     result[symbol] = quote_data[nse_symbol]
                 else:
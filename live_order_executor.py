@@ -8,8 +8,7 @@ This bridges your dashboard to actual Breeze API order placement
 import streamlit as st
 from typing import Optional, Dict, Any
 from datetime import datetime
-import logging
-from kite_api_client import KiteAPIClient
+from kite_api_client import get_kite_client
 
 class LiveOrderExecutor:
     """Execute real orders through Breeze API"""
@@ -22,8 +21,8 @@ class LiveOrderExecutor:
     def initialize_client(self):
         """Initialize live Kite API client"""
         try:
-            # Initialize Kite API client
-            self.client = KiteAPIClient()
+            # Reuse the shared Kite API client
+            self.client = get_kite_client()
             
             if self.client.test_connection():
                 self.is_live_mode = True
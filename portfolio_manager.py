@@ -3,7 +3,6 @@ Turtle Trader - Portfolio Management Module
 Advanced portfolio management with performance tracking
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -309,23 +308,33 @@ class PortfolioManager:
         """Get detailed position breakdown"""
         breakdown = []
         
-        total_value = sum(abs(pos.quantity * pos.current_price) for pos in positions)
-        
-        for pos in positions:
-            if pos.quantity != 0:
-                position_value = abs(pos.quantity * pos.current_price)
-                weight = position_value / total_value if total_value > 0 else 0
-                
-                breakdown.append({
-                    'symbol': pos.symbol,
-                    'quantity': pos.quantity,
-                    'avg_price': pos.average_price,
-                    'current_price': pos.current_price,
-                    'market_value': position_value,
-                    'unrealized_pnl': pos.unrealized_pnl,
-                    'weight': weight,
-                    'return_pct': ((pos.current_price - pos.average_price) / pos.average_price * 100) if pos.average_price > 0 else 0
-                })
+        held = [pos for pos in positions if pos.quantity != 0]
+        if not held:
+            return breakdown
+        
+        # Value, weight and return % for every position in one vectorized pass
+        n = len(held)
+        quantities = np.fromiter((pos.quantity for pos in held), dtype=np.float64, count=n)
+        current = np.fromiter((pos.current_price for pos in held), dtype=np.float64, count=n)
+        average = np.fromiter((pos.average_price for pos in held), dtype=np.float64, count=n)
+        
+        values = np.abs(quantities * current)
+        total_value = values.sum()
+        weights = values / total_value if total_value > 0 else np.zeros(n)
+        has_cost = average > 0
+        returns = np.where(has_cost, (current - average) / np.where(has_cost, average, 1.0) * 100, 0.0)
+        
+        for pos, position_value, weight, return_pct in zip(held, values.tolist(), weights.tolist(), returns.tolist()):
+            breakdown.append({
+                'symbol': pos.symbol,
+                'quantity': pos.quantity,
+                'avg_price': pos.average_price,
+                'current_price': pos.current_price,
+                'market_value': position_value,
+                'unrealized_pnl': pos.unrealized_pnl,
+                'weight': weight,
+                'return_pct': return_pct
+            })
         
         # Sort by market value
         breakdown.sort(key=lambda x: x['market_value'], reverse=True)
@@ -5,16 +5,16 @@
 Dynamic Capital Allocation based on ACTUAL Kite API account balance
 """
 
-import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 from kite_api_client import KiteAPIClient
+from core.compat import DATACLASS_SLOTS, dumps_indented
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AccountBalance:
     """Real-time account balance data"""
     available_cash: float
@@ -47,6 +47,7 @@ class RealAccountBalanceManager:
         """Initialize with Kite API client"""
         self.api_client = KiteAPIClient(config_path)
         self.last_balance_check = None
+        self._last_check_mono: Optional[float] = None  # monotonic clock for cache expiry
         self.current_balance = None
         self.balance_cache_duration = timedelta(minutes=5)  # Cache for 5 minutes
         
@@ -93,6 +94,7 @@ class RealAccountBalanceManager:
             
             # Calculate free cash (available for trading)
             free_cash = available_cash - margin_used
+            now = datetime.now()
             
             balance = AccountBalance(
                 available_cash=available_cash,
@@ -100,11 +102,12 @@ class RealAccountBalanceManager:
                 total_balance=total_balance,
                 portfolio_value=portfolio_value,
                 free_cash=max(0, free_cash),  # Ensure non-negative
-                timestamp=datetime.now()
+                timestamp=now
             )
             
             self.current_balance = balance
-            self.last_balance_check = datetime.now()
+            self.last_balance_check = now
+            self._last_check_mono = time.monotonic()
             
             logger.info(f"✅ Account balance updated: ₹{available_cash:,.2f} available")
             return balance
@@ -118,8 +121,8 @@ class RealAccountBalanceManager:
         
         # Check if we need to refresh cache
         if (force_refresh or 
-            self.last_balance_check is None or 
-            datetime.now() - self.last_balance_check > self.balance_cache_duration):
+            self._last_check_mono is None or 
+            time.monotonic() - self._last_check_mono > self.balance_cache_duration.total_seconds()):
             
             return self.fetch_real_account_balance()
         
@@ -171,8 +174,11 @@ class RealAccountBalanceManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = f"real_balance_snapshot_{timestamp}.json"
         
-        with open(filepath, 'w') as f:
-            json.dump(allocation, f, indent=2)
+        # Serialize in one shot and write once; orjson when available
+        payload = dumps_indented(allocation)
+        
+        with open(filepath, 'wb') as f:
+            f.write(payload)
         
         logger.info(f"💾 Balance snapshot saved to {filepath}")
         return filepath
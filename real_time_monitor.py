@@ -8,12 +8,13 @@ real Breeze API account balance changes.
 
 import time
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Callable
 from dataclasses import dataclass
 from loguru import logger
-import json
 
+from core.config import Utils
 from real_account_balance import RealAccountBalanceManager, AccountBalance
 from dynamic_capital_allocator import DynamicCapitalAllocator
 
@@ -36,7 +37,8 @@ class RealTimeAccountMonitor:
                  capital_allocator: DynamicCapitalAllocator,
                  check_interval_minutes: int = 5,
                  significant_change_threshold: float = 0.05,  # 5% change threshold
-                 auto_adjust: bool = True):
+                 auto_adjust: bool = True,
+                 market_hours_only: bool = True):
         """
         Initialize real-time monitor
         
@@ -45,6 +47,7 @@ class RealTimeAccountMonitor:
             check_interval_minutes: How often to check balance (minutes)
             significant_change_threshold: Threshold for significant changes (%)
             auto_adjust: Whether to automatically adjust allocation on changes
+            market_hours_only: Skip scheduled checks while the market is closed
         """
         
         self.capital_allocator = capital_allocator
@@ -52,12 +55,14 @@ class RealTimeAccountMonitor:
         self.check_interval = timedelta(minutes=check_interval_minutes)
         self.change_threshold = significant_change_threshold
         self.auto_adjust = auto_adjust
+        self.market_hours_only = market_hours_only
         
         # Monitoring state
         self.is_monitoring = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
         self.last_balance = None
-        self.balance_history = []
+        self.balance_history = deque(maxlen=100)  # Keep only last 100 entries
         self.change_events = []
         
         # Callbacks for events
@@ -81,6 +86,7 @@ class RealTimeAccountMonitor:
             return
         
         self.is_monitoring = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitor_thread.start()
         
@@ -92,6 +98,7 @@ class RealTimeAccountMonitor:
             return
         
         self.is_monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         
@@ -103,12 +110,15 @@ class RealTimeAccountMonitor:
         
         while self.is_monitoring:
             try:
-                self._check_balance_changes()
-                time.sleep(self.check_interval.total_seconds())
+                # Nothing trades after hours; the first in-session check catches up
+                if not self.market_hours_only or Utils.is_market_open():
+                    self._check_balance_changes()
+                # Wait on the stop event so stop_monitoring wakes us immediately
+                self._stop_event.wait(self.check_interval.total_seconds())
                 
             except Exception as e:
                 logger.error(f"❌ Monitor loop error: {e}")
-                time.sleep(60)  # Wait 1 minute on error
+                self._stop_event.wait(60)  # Wait 1 minute on error
     
     def _check_balance_changes(self):
         """Check for balance changes and trigger events"""
@@ -126,10 +136,6 @@ class RealTimeAccountMonitor:
                 'portfolio_value': current_balance.portfolio_value
             })
             
-            # Keep only last 100 entries
-            if len(self.balance_history) > 100:
-                self.balance_history = self.balance_history[-100:]
-            
             # Check for changes if we have previous balance
             if self.last_balance:
                 change_amount = current_balance.free_cash - self.last_balance.free_cash
@@ -137,9 +143,9 @@ class RealTimeAccountMonitor:
                 if abs(change_amount) > 0:  # Any change
                     change_percentage = abs(change_amount) / self.last_balance.free_cash
                     
-                    # Create change event
+                    # Create change event, stamped with this tick's fetch time
                     event = BalanceChangeEvent(
-                        timestamp=datetime.now(),
+                        timestamp=current_balance.timestamp,
                         old_balance=self.last_balance.free_cash,
                         new_balance=current_balance.free_cash,
                         change_amount=change_amount,
@@ -188,7 +194,8 @@ class RealTimeAccountMonitor:
         try:
             logger.info("⚡ Auto-adjusting capital allocation...")
             
-            success = self.capital_allocator.refresh_real_balance()
+            # Only a balance fetched after the change may drive the rebalance
+            success = self.capital_allocator.refresh_real_balance(not_before=event.timestamp)
             if success:
                 logger.info("✅ Capital allocation auto-adjusted successfully")
                 
@@ -211,6 +218,7 @@ class RealTimeAccountMonitor:
                 'is_active': self.is_monitoring,
                 'check_interval_minutes': self.check_interval.total_seconds() / 60,
                 'auto_adjust_enabled': self.auto_adjust,
+                'market_hours_only': self.market_hours_only,
                 'change_threshold_pct': self.change_threshold * 100
             },
             'balance_history': {
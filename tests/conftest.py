@@ -0,0 +1,6 @@
+"""Pytest configuration: make the top-level trading modules importable"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
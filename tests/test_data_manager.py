@@ -0,0 +1,86 @@
+"""Tests for DataManager's batched real-time quote path"""
+
+import threading
+from collections import OrderedDict
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+data_manager = pytest.importorskip("data_manager")
+
+
+class StubKiteClient:
+    """Mimics KiteAPIClient.get_quote: bare symbols in, results keyed by bare symbol"""
+
+    def __init__(self, quotes):
+        self.quotes = quotes
+        self.quote_calls = []
+
+    def get_quote(self, symbols):
+        self.quote_calls.append(list(symbols))
+        return {symbol: self.quotes[symbol] for symbol in symbols if symbol in self.quotes}
+
+
+def make_manager(kite):
+    """DataManager wired to a stub client, skipping the DB/Kite setup in __init__"""
+    manager = data_manager.DataManager.__new__(data_manager.DataManager)
+    manager.cache = OrderedDict()
+    manager.cache_expiry = {}
+    manager.cache_duration = 300
+    manager.cache_max_entries = 128
+    manager._cache_lock = threading.Lock()
+    manager._fallback_pool = None
+    manager.kite = kite
+    return manager
+
+
+QUOTES = {
+    'NIFTYBEES': {'last_price': 250.5, 'volume': 1200,
+                  'ohlc': {'open': 248.0, 'high': 251.0, 'low': 247.5}},
+    'BANKBEES': {'last_price': 510.25, 'volume': 800,
+                 'ohlc': {'open': 505.0, 'high': 512.0, 'low': 504.0}},
+}
+
+
+def test_batch_quote_hits_without_per_symbol_fallback():
+    kite = StubKiteClient(QUOTES)
+    manager = make_manager(kite)
+    fallback_calls = []
+    manager.get_real_time_data = lambda symbol, exchange=None: fallback_calls.append(symbol)
+
+    result = manager.get_real_time_data_batch(['NIFTYBEES', 'BANKBEES'])
+
+    assert kite.quote_calls == [['NIFTYBEES', 'BANKBEES']]
+    assert fallback_calls == []
+    assert result['NIFTYBEES']['close'].iloc[-1] == 250.5
+    assert result['NIFTYBEES']['open'].iloc[-1] == 248.0
+    assert result['BANKBEES']['volume'].iloc[-1] == 800
+
+
+def test_batch_serves_repeat_calls_from_cache():
+    kite = StubKiteClient(QUOTES)
+    manager = make_manager(kite)
+
+    manager.get_real_time_data_batch(['NIFTYBEES', 'BANKBEES'])
+    result = manager.get_real_time_data_batch(['NIFTYBEES', 'BANKBEES'])
+
+    assert len(kite.quote_calls) == 1
+    assert set(result) == {'NIFTYBEES', 'BANKBEES'}
+
+
+def test_batch_falls_back_only_for_unquoted_symbols():
+    kite = StubKiteClient(QUOTES)
+    manager = make_manager(kite)
+    fallback_calls = []
+
+    def fallback(symbol, exchange=None):
+        fallback_calls.append(symbol)
+        return pd.DataFrame()
+
+    manager.get_real_time_data = fallback
+
+    result = manager.get_real_time_data_batch(['NIFTYBEES', 'UNKNOWNETF'])
+
+    assert fallback_calls == ['UNKNOWNETF']
+    assert result['NIFTYBEES']['close'].iloc[-1] == 250.5
+    assert result['UNKNOWNETF'].empty
@@ -0,0 +1,80 @@
+"""Tests that the batch and single-signal allocation paths agree"""
+
+import sys
+import types
+from datetime import datetime
+
+import pytest
+
+dynamic_capital_allocator = pytest.importorskip("dynamic_capital_allocator")
+
+
+class StubBalance:
+    def __init__(self, free_cash):
+        self.free_cash = free_cash
+        self.timestamp = datetime.now()
+
+
+@pytest.fixture
+def make_allocator(monkeypatch):
+    """Build allocators on a stubbed real-balance manager holding ``free_cash``"""
+
+    def make(free_cash):
+        class StubBalanceManager:
+            def get_current_balance(self, force_refresh=False):
+                return StubBalance(free_cash)
+
+        module = types.ModuleType("real_account_balance")
+        module.RealAccountBalanceManager = StubBalanceManager
+        monkeypatch.setitem(sys.modules, "real_account_balance", module)
+        allocator = dynamic_capital_allocator.DynamicCapitalAllocator()
+        allocator._executor.shutdown(wait=False)
+        return allocator
+
+    return make
+
+
+def make_signals():
+    TradeSignal = dynamic_capital_allocator.TradeSignal
+    return [TradeSignal(f"ETF{i}", 'SELL' if i == 2 else 'BUY', 100.0 + i, 'HIGH') for i in range(8)]
+
+
+# ₹0.20 leaves a zero per-trade allocation; ₹10,000 sizes ₹350 trades with room for 20
+@pytest.mark.parametrize("free_cash", [0.20, 10_000.0])
+@pytest.mark.parametrize("use_kernel", [True, False])
+def test_batch_matches_single_signal_path(make_allocator, monkeypatch, free_cash, use_kernel):
+    single = make_allocator(free_cash)
+    expected = [single.process_trade_signal(signal)['status'] == 'EXECUTED' for signal in make_signals()]
+
+    monkeypatch.setattr(dynamic_capital_allocator, "NUMBA_AVAILABLE", use_kernel)
+    batch = make_allocator(free_cash)
+    executed = batch.process_signal_batch(make_signals())
+
+    assert executed.tolist() == expected
+    assert batch.allocated_capital == single.allocated_capital
+    assert batch.available_deployment_capital == single.available_deployment_capital
+    assert [t.symbol for t in batch.active_trades] == [t.symbol for t in single.active_trades]
+
+
+def test_zero_allocation_rejects_every_buy(make_allocator):
+    allocator = make_allocator(0.20)
+
+    result = allocator.process_trade_signal(make_signals()[0])
+
+    assert allocator.per_trade_amount == 0
+    assert result['status'] == 'REJECTED'
+    assert result['shortfall'] == 0
+    assert not allocator.active_trades
+
+
+def test_batch_stops_when_capital_runs_out(make_allocator, monkeypatch):
+    TradeSignal = dynamic_capital_allocator.TradeSignal
+    signals = [TradeSignal(f"ETF{i}", 'BUY', 50.0, 'HIGH') for i in range(25)]
+
+    for use_kernel in (True, False):
+        monkeypatch.setattr(dynamic_capital_allocator, "NUMBA_AVAILABLE", use_kernel)
+        allocator = make_allocator(10_000.0)
+        executed = allocator.process_signal_batch(signals)
+
+        assert executed.tolist() == [True] * 20 + [False] * 5
+        assert allocator.available_deployment_capital == 0
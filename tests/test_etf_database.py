@@ -0,0 +1,37 @@
+"""Tests for IndianETFDatabase's market-data batch frame"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+etf_database = pytest.importorskip("etf_database")
+
+
+@pytest.fixture(scope="module")
+def db():
+    return etf_database.IndianETFDatabase()
+
+
+def test_batch_columns_and_dtypes(db):
+    df = db.get_market_data_batch(['NIFTYBEES', 'BANKBEES'])
+
+    assert list(df.columns) == ['Symbol', 'Name', 'Category', 'NSE_Symbol', 'Priority',
+                                'Price', 'Change %', 'Volume', 'Status']
+    assert df['Priority'].dtype == 'int64'
+    assert df['Price'].dtype == 'float64'
+    assert df['Volume'].dtype == 'int64'
+    assert df['Category'].tolist() == ['Broad Market', 'Sectoral']
+    assert df['NSE_Symbol'].tolist() == ['NIFTYBEES.NS', 'BANKBEES.NS']
+
+
+def test_batch_echoes_caller_symbols_and_skips_unknown(db):
+    df = db.get_market_data_batch(['niftybees', 'NOTANETF', 'BankBees'])
+
+    assert df['Symbol'].tolist() == ['niftybees', 'BankBees']
+    assert df['Name'].tolist() == [db.etfs['NIFTYBEES'].name, db.etfs['BANKBEES'].name]
+
+
+def test_default_batch_has_one_row_per_etf(db):
+    df = db.get_market_data_batch()
+
+    assert df['Symbol'].is_unique
+    assert df['Symbol'].tolist() == db.get_liquid_etfs('MEDIUM')
@@ -0,0 +1,55 @@
+"""Tests for ETFOrderManager's pooled market data fetch"""
+
+import pytest
+
+etf_manager = pytest.importorskip("etf_manager")
+
+ZERO_QUOTE = {'ltp': 0, 'open': 0, 'high': 0, 'low': 0, 'volume': 0, 'change': 0, 'change_percent': 0}
+
+
+class StubQuoteClient:
+    """Answers get_quotes for known symbols and raises for the rest"""
+
+    def __init__(self, quotes):
+        self.quotes = quotes
+
+    def get_quotes(self, stock_code, exchange_code):
+        return self.quotes[stock_code]
+
+
+@pytest.fixture
+def manager():
+    manager = etf_manager.ETFOrderManager.__new__(etf_manager.ETFOrderManager)
+    manager.etf_symbols = ['NIFTYBEES', 'GOLDBEES']
+    manager._quote_pool = None
+    yield manager
+    manager.shutdown()
+
+
+def test_missing_client_method_zero_fills_each_symbol(manager, monkeypatch):
+    monkeypatch.setattr(etf_manager, 'api_client', object())
+
+    assert manager.get_etf_market_data() == {'NIFTYBEES': ZERO_QUOTE, 'GOLDBEES': ZERO_QUOTE}
+
+
+def test_failure_stays_with_its_symbol(manager, monkeypatch):
+    client = StubQuoteClient({'NIFTYBEES': {'Success': True, 'ltp': 250.5, 'volume': 1200}})
+    monkeypatch.setattr(etf_manager, 'api_client', client)
+
+    data = manager.get_etf_market_data()
+
+    assert data['NIFTYBEES']['ltp'] == 250.5
+    assert data['NIFTYBEES']['volume'] == 1200
+    assert data['GOLDBEES'] == ZERO_QUOTE
+
+
+def test_shutdown_releases_pool_and_next_call_recreates_it(manager, monkeypatch):
+    monkeypatch.setattr(etf_manager, 'api_client', StubQuoteClient({}))
+    manager.get_etf_market_data()
+    pool = manager._quote_pool
+
+    manager.shutdown()
+
+    assert pool._shutdown and manager._quote_pool is None
+    assert manager.get_etf_market_data()['GOLDBEES'] == ZERO_QUOTE
+    assert manager._quote_pool is not None